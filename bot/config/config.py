@@ -1,114 +1,222 @@
 import os
-from typing import List, Optional
+import re
+from functools import cached_property
+from typing import List, Optional, Set
 from dotenv import load_dotenv
 from loguru import logger
 
-# Load environment variables
-load_dotenv()
+# Load environment variables exactly once, then snapshot them so every
+# lookup below is a plain dict read instead of an os.getenv call
+_LOADED = False
 
-class Config:
+def _load_env() -> None:
+    global _LOADED
+    if not _LOADED:
+        load_dotenv()
+        _LOADED = True
+
+_load_env()
+_ENV = os.environ.copy()
+# Numeric settings are parsed straight from bytes, skipping the str decode
+_ENVB = dict(os.environb) if os.supports_bytes_environ else None
+
+_INT_RE = re.compile(r"-?\d+")
+
+
+def _getint(key: str, default: int = 0) -> int:
+    """Read an integer setting, falling back to default when unset or empty"""
+    raw = _ENVB.get(key.encode()) if _ENVB is not None else _ENV.get(key)
+    return int(raw) if raw else default
+
+
+def _parse_int_list(key: str) -> List[int]:
+    """Parse a comma-separated list of integer IDs in a single regex pass"""
+    raw = _ENV.get(key, "")
+    if not raw:
+        return []
+    return list(map(int, _INT_RE.findall(raw)))
+
+
+def _parse_int_set(key: str) -> Set[int]:
+    """Parse a comma-separated list of integer IDs into a set for O(1) membership checks"""
+    return set(_parse_int_list(key))
+
+
+class _ConfigSingleton:
     """
     Centralized configuration class for the Telegram Bot.
     Uses environment variables for flexible configuration.
+
+    Fields are parsed lazily on first access and memoized, so code paths
+    that only touch a few settings don't pay for parsing all of them.
     """
-    
+
+    _instance: Optional["_ConfigSingleton"] = None
+    _validated: Optional[bool] = None
+
+    def __new__(cls) -> "_ConfigSingleton":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     # Bot Authentication Credentials
-    USER_SESSION_STRING: Optional[str] = os.getenv("USERBOT_STRING_SESSION")
-    TEMP_CHANNEL: int = int(os.getenv("TEMP_CHANNEL", "0"))
-    BOT_TOKEN: str = os.getenv("BOT_TOKEN", "")
-    API_ID: int = int(os.getenv("API_ID", "0"))
-    API_HASH: str = os.getenv("API_HASH", "")
-    USERNAME_OF_BOT: Optional[str] = os.getenv("USERNAME_OF_BOT")
+    @cached_property
+    def USER_SESSION_STRING(self) -> Optional[str]:
+        return _ENV.get("USERBOT_STRING_SESSION")
+
+    @cached_property
+    def TEMP_CHANNEL(self) -> int:
+        return _getint("TEMP_CHANNEL")
+
+    @cached_property
+    def BOT_TOKEN(self) -> str:
+        return _ENV.get("BOT_TOKEN", "")
+
+    @cached_property
+    def API_ID(self) -> int:
+        return _getint("API_ID")
+
+    @cached_property
+    def API_HASH(self) -> str:
+        return _ENV.get("API_HASH", "")
+
+    @cached_property
+    def USERNAME_OF_BOT(self) -> Optional[str]:
+        return _ENV.get("USERNAME_OF_BOT")
+
     # Database Configuration
-    DB_URL: Optional[str] = os.getenv("MONGODB_URL")
-    
+    @cached_property
+    def DB_URL(self) -> Optional[str]:
+        return _ENV.get("MONGODB_URL")
+
     # Access Control
-    OWNER_ID: int = int(os.getenv("OWNER_ID", "0"))
-    AUTHORIZED_GROUPS: List[int] = [
-        int(group_id.strip()) 
-        for group_id in os.getenv("AUTHORIZED_GROUPS", "").split(",") 
-        if group_id.strip()
-    ]
-    ADMIN_IDS: List[int] = [
-        int(admin_id.strip()) 
-        for admin_id in os.getenv("ADMIN_IDS", "").split(",") 
-        if admin_id.strip()
-    ]
-    
+    @cached_property
+    def OWNER_ID(self) -> int:
+        return _getint("OWNER_ID")
+
+    @cached_property
+    def AUTHORIZED_GROUPS(self) -> Set[int]:
+        return _parse_int_set("AUTHORIZED_GROUPS")
+
+    @cached_property
+    def ADMIN_IDS(self) -> Set[int]:
+        return _parse_int_set("ADMIN_IDS")
+
     # Channel Configuration
-    FORCE_SUB_ENABLED: bool = os.getenv("FORCE_SUB_ENABLED", "False").lower() == "true"
-    FORCE_SUB_CHANNEL: Optional[int] = (
-        int(os.getenv("FORCE_SUB_CHANNEL", "0"))
-        if os.getenv("FORCE_SUB_ENABLED", "False").lower() == "true"
-        else None
-    )
-    SEARCH_CHANNELS: List[int] = [
-        int(channel_id.strip()) 
-        for channel_id in os.getenv("SEARCH_CHANNELS", "").split(",") 
-        if channel_id.strip()
-    ]
-    LOG_CHANNEL: Optional[int] = int(os.getenv("LOG_CHANNEL", "0")) or None
-    
+    @cached_property
+    def FORCE_SUB_ENABLED(self) -> bool:
+        return _ENV.get("FORCE_SUB_ENABLED", "False").lower() == "true"
+
+    @cached_property
+    def FORCE_SUB_CHANNEL(self) -> Optional[int]:
+        return (
+            _getint("FORCE_SUB_CHANNEL")
+            if self.FORCE_SUB_ENABLED
+            else None
+        )
+
+    @cached_property
+    def SEARCH_CHANNELS(self) -> List[int]:
+        return _parse_int_list("SEARCH_CHANNELS")
+
+    @cached_property
+    def LOG_CHANNEL(self) -> Optional[int]:
+        return _getint("LOG_CHANNEL") or None
+
     # Bot Performance and Limits
-    WORKERS: int = int(os.getenv("WORKERS", "4"))
-    MAX_RESULTS: int = int(os.getenv("MAX_RESULTS", "50"))
-    MIN_SEARCH_LENGTH: int = int(os.getenv("MIN_SEARCH_LENGTH", "3"))
-    MAX_CONCURRENT_TRANSMISSIONS: int = int(os.getenv("MAX_CONCURRENT_TRANSMISSIONS", "10"))
-    
+    @cached_property
+    def WORKERS(self) -> int:
+        return _getint("WORKERS", 4)
+
+    @cached_property
+    def MAX_RESULTS(self) -> int:
+        return _getint("MAX_RESULTS", 50)
+
+    @cached_property
+    def MIN_SEARCH_LENGTH(self) -> int:
+        return _getint("MIN_SEARCH_LENGTH", 3)
+
+    @cached_property
+    def MAX_CONCURRENT_TRANSMISSIONS(self) -> int:
+        return _getint("MAX_CONCURRENT_TRANSMISSIONS", 10)
+
     # Cleanup and Timeout Settings
-    DELETE_TIMEOUT: int = int(os.getenv("DELETE_TIMEOUT", "600"))  # 10 minutes
-    CACHE_CLEANUP_DAYS: int = int(os.getenv("CACHE_CLEANUP_DAYS", "30"))
-    MAX_CACHE_SIZE: int = int(os.getenv("MAX_CACHE_SIZE", "10000"))
-    
+    @cached_property
+    def DELETE_TIMEOUT(self) -> int:
+        return _getint("DELETE_TIMEOUT", 600)  # 10 minutes
+
+    @cached_property
+    def CACHE_CLEANUP_DAYS(self) -> int:
+        return _getint("CACHE_CLEANUP_DAYS", 30)
+
+    @cached_property
+    def MAX_CACHE_SIZE(self) -> int:
+        return _getint("MAX_CACHE_SIZE", 10000)
+
     # Customization
-    START_PIC: str = os.getenv("START_PIC", "https://telegra.ph/file/default-start-pic.jpg")
-    
+    @cached_property
+    def START_PIC(self) -> str:
+        return _ENV.get("START_PIC", "https://telegra.ph/file/default-start-pic.jpg")
+
     # Bot Metadata
-    VERSION: str = os.getenv("VERSION", "")
-    
-    @classmethod
-    def validate(cls) -> bool:
+    @cached_property
+    def VERSION(self) -> str:
+        return _ENV.get("VERSION", "")
+
+    def validate(self) -> bool:
         """
         Validate critical configuration parameters.
+
+        The result is memoized since the critical settings are fixed once
+        the environment has been loaded.
         
         Returns:
             bool: True if all critical configurations are set, False otherwise.
         """
+        if self._validated is None:
+            self._validated = self._check_critical()
+        return self._validated
+
+    def _check_critical(self) -> bool:
+        """Evaluate the critical configuration checks"""
         critical_configs = [
-            cls.BOT_TOKEN,
-            cls.API_ID,
-            cls.API_HASH,
-            cls.OWNER_ID,
-            cls.TEMP_CHANNEL
+            self.BOT_TOKEN,
+            self.API_ID,
+            self.API_HASH,
+            self.OWNER_ID,
+            self.TEMP_CHANNEL
         ]
         
         # Validate force sub configuration if enabled
-        if cls.FORCE_SUB_ENABLED and not cls.FORCE_SUB_CHANNEL:
+        if self.FORCE_SUB_ENABLED and not self.FORCE_SUB_CHANNEL:
             logger.warning("Force subscribe is enabled but no channel ID is provided!")
             return False
             
         return all(critical_configs)
 
-    @classmethod
-    def debug_info(cls) -> str:
+    def debug_info(self) -> str:
         """Get debug information about configuration"""
-        info = {
-            "Bot Token": "✅ Set" if cls.BOT_TOKEN else "❌ Not Set",
-            "API ID": "✅ Set" if cls.API_ID != 0 else "❌ Not Set",
-            "API Hash": "✅ Set" if cls.API_HASH else "❌ Not Set",
-            "Database URL": "✅ Set" if cls.DB_URL else "❌ Not Set",
-            "Owner ID": cls.OWNER_ID,
-            "Admin IDs": len(cls.ADMIN_IDS),
-            "Authorized Groups": cls.AUTHORIZED_GROUPS,
-            "Force Sub Channel": cls.FORCE_SUB_CHANNEL,
-            "Search Channels": len(cls.SEARCH_CHANNELS),
-            "Log Channel": cls.LOG_CHANNEL,
-            "Workers": cls.WORKERS,
-            "Max Results": cls.MAX_RESULTS,
-            "Min Search Length": cls.MIN_SEARCH_LENGTH,
-            "Delete Timeout": f"{cls.DELETE_TIMEOUT} seconds",
-            "Cache Cleanup Days": cls.CACHE_CLEANUP_DAYS,
-            "Version": cls.VERSION or "Not Set"
-        }
-        
-        return "\n".join(f"{k}: {v}" for k, v in info.items())
\ No newline at end of file
+        return "\n".join(f"{label}: {field(self)}" for label, field in _DEBUG_FIELDS)
+
+
+# (label, getter) pairs rendered by Config.debug_info(), in display order
+_DEBUG_FIELDS = (
+    ("Bot Token", lambda c: "✅ Set" if c.BOT_TOKEN else "❌ Not Set"),
+    ("API ID", lambda c: "✅ Set" if c.API_ID != 0 else "❌ Not Set"),
+    ("API Hash", lambda c: "✅ Set" if c.API_HASH else "❌ Not Set"),
+    ("Database URL", lambda c: "✅ Set" if c.DB_URL else "❌ Not Set"),
+    ("Owner ID", lambda c: c.OWNER_ID),
+    ("Admin IDs", lambda c: len(c.ADMIN_IDS)),
+    ("Authorized Groups", lambda c: sorted(c.AUTHORIZED_GROUPS)),
+    ("Force Sub Channel", lambda c: c.FORCE_SUB_CHANNEL),
+    ("Search Channels", lambda c: len(c.SEARCH_CHANNELS)),
+    ("Log Channel", lambda c: c.LOG_CHANNEL),
+    ("Workers", lambda c: c.WORKERS),
+    ("Max Results", lambda c: c.MAX_RESULTS),
+    ("Min Search Length", lambda c: c.MIN_SEARCH_LENGTH),
+    ("Delete Timeout", lambda c: f"{c.DELETE_TIMEOUT} seconds"),
+    ("Cache Cleanup Days", lambda c: c.CACHE_CLEANUP_DAYS),
+    ("Version", lambda c: c.VERSION or "Not Set"),
+)
+
+Config = _ConfigSingleton()
@@ -1,13 +1,52 @@
 # bot/database/models.py
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+import base64
+import hashlib
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
+from cachetools import TTLCache
 from loguru import logger
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
 
 # Type checking imports
 if TYPE_CHECKING:
     from motor.motor_asyncio import AsyncIOMotorDatabase
 
+# In-process caches shared by every FileCache instance
+_short_id_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_file_doc_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+# Fields needed to list a cached file in search results; file_unique_id and
+# date are kept for de-duplication against live channel results
+_SEARCH_PROJECTION = {
+    '_id': 0, 'file_id': 1, 'file_unique_id': 1, 'file_name': 1, 'file_size': 1,
+    'mime_type': 1, 'type': 1, 'channel_id': 1, 'message_id': 1, 'date': 1,
+    'access_count': 1
+}
+_POPULAR_PROJECTION = {'_id': 0, 'file_id': 1, 'file_name': 1, 'access_count': 1}
+
+def _text_search_terms(query: str) -> str:
+    """Plain words for $search, so '-word' and quotes aren't read as negation or phrases"""
+    return ' '.join(filter(None, (term.lstrip('-') for term in query.replace('"', ' ').split())))
+
+@lru_cache(maxsize=65536)
+def make_short_id(file_id: str) -> str:
+    """Short, callback-safe identifier for a file ID"""
+    return base64.urlsafe_b64encode(
+        hashlib.blake2b(file_id.encode(), digest_size=6).digest()
+    ).decode('ascii')
+
+def _evict_cached_file(file_id: str) -> None:
+    """Drop in-process entries for a file whose cached doc was just rewritten"""
+    _file_doc_cache.pop(file_id, None)
+    _short_id_cache.pop(make_short_id(file_id), None)
+
+# Pending access_count increments, written in batches by FileCache.flush_access_counts
+_access_counter: Dict[str, int] = defaultdict(int)
+
 class User:
     collection: AsyncIOMotorCollection
 
@@ -16,11 +55,12 @@ class User:
 
     async def create_user(self, user_id: int, username: Optional[str] = None) -> bool:
         """Create a new user in database"""
+        now = datetime.now(timezone.utc)
         user_data = {
             'user_id': user_id,
             'username': username,
-            'joined_date': datetime.now(),
-            'last_used': datetime.now(),
+            'joined_date': now,
+            'last_used': now,
             'searches': 0,
             'downloads': 0,
             'banned': False
@@ -37,21 +77,20 @@ class User:
 
     async def update_user_stats(self, user_id: int, search: bool = False, download: bool = False) -> bool:
         """Update user statistics"""
-        update_data: Dict[str, Any] = {
-            'last_used': datetime.now()
-        }
+        update_ops: Dict[str, Any] = {'$set': {'last_used': datetime.now(timezone.utc)}}
+        increments = {}
         if search:
-            update_data['$inc'] = {'searches': 1}
+            increments['searches'] = 1
         if download:
-            update_data['$inc'] = {'downloads': 1}
-        
+            increments['downloads'] = 1
+        if increments:
+            update_ops['$inc'] = increments
+
         try:
-            await self.collection.update_one(
-                {'user_id': user_id},
-                {'$set': update_data}
-            )
+            await self.collection.update_one({'user_id': user_id}, update_ops)
             return True
-        except Exception:
+        except PyMongoError as e:
+            logger.error(f"Error updating stats for user {user_id}: {e}")
             return False
 
     async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -76,25 +115,49 @@ class FileCache:
 
 
     async def increment_access_count(self, file_id: str) -> bool:
-        """Increment the access count for a file"""
-        try:
-            result = await self.collection.update_one(
+        """Record an access; counts are written in batches by flush_access_counts"""
+        _access_counter[file_id] += 1
+        cached = _file_doc_cache.get(file_id)
+        if cached is not None:
+            cached['access_count'] = cached.get('access_count', 0) + 1
+        return True
+
+    async def flush_access_counts(self) -> int:
+        """Write pending access counts with one $inc per distinct file"""
+        if not _access_counter:
+            return 0
+
+        snapshot = dict(_access_counter)
+        _access_counter.clear()
+        now = datetime.now(timezone.utc)
+        ops = [
+            UpdateOne(
                 {'file_id': file_id},
-                {
-                    '$inc': {'access_count': 1},
-                    '$set': {'last_accessed': datetime.now()}
-                }
+                {'$inc': {'access_count': count}, '$set': {'last_accessed': now}}
             )
-            return result.modified_count > 0
+            for file_id, count in snapshot.items()
+        ]
+        try:
+            await self.collection.bulk_write(ops, ordered=False)
+            return len(ops)
         except Exception as e:
-            logger.error(f"Error incrementing access count: {e}")
-            return False
+            logger.error(f"Error flushing access counts: {e}")
+            # Keep the counts for the next flush
+            for file_id, count in snapshot.items():
+                _access_counter[file_id] += count
+            return 0
 
     async def get_file_id_from_short_id(self, short_id: str) -> Optional[str]:
         """Get the original file ID from a short ID"""
+        file_id = _short_id_cache.get(short_id)
+        if file_id is not None:
+            return file_id
         try:
             mapping = await self.id_mappings.find_one({'short_id': short_id})
-            return mapping['file_id'] if mapping else None
+            if not mapping:
+                return None
+            _short_id_cache[short_id] = mapping['file_id']
+            return mapping['file_id']
         except Exception as e:
             logger.error(f"Error retrieving file ID from short ID: {e}")
             return None
@@ -102,15 +165,23 @@ class FileCache:
     async def update_file_id(self, file_unique_id: str, new_file_id: str) -> bool:
         """Update file ID for a file"""
         try:
+            # file_unique_id is indexed but not unique (the same file can be cached
+            # from several channels), so this stays update_many; docs already
+            # carrying the new ID are skipped rather than rewritten
             result = await self.collection.update_many(
-                {'file_unique_id': file_unique_id},
+                {'file_unique_id': file_unique_id, 'file_id': {'$ne': new_file_id}},
                 {
                     '$set': {
                         'file_id': new_file_id,
-                        'last_updated': datetime.now()
+                        'short_id': make_short_id(new_file_id),
+                        'last_updated': datetime.now(timezone.utc)
                     }
                 }
             )
+            # Drop in-process entries still pointing at the stale file ID
+            for cached_id, doc in list(_file_doc_cache.items()):
+                if doc.get('file_unique_id') == file_unique_id:
+                    _file_doc_cache.pop(cached_id, None)
             return result.modified_count > 0
         except Exception as e:
             logger.error(f"Error updating file ID: {e}")
@@ -124,83 +195,233 @@ class FileCache:
                 {
                     '$set': {
                         'file_id': file_id,
-                        'created_at': datetime.now()
+                        'created_at': datetime.now(timezone.utc)
                     }
                 },
                 upsert=True
             )
+            _short_id_cache[short_id] = file_id
             return True
         except Exception as e:
             logger.error(f"Error caching short ID mapping: {e}")
             return False
 
+    async def cache_short_id_mappings_bulk(self, pairs: List[Tuple[str, str]]) -> int:
+        """Upsert many short ID -> file ID mappings in one unordered bulk write"""
+        # Mappings already in the process cache were persisted when they were added
+        pending = {
+            short_id: file_id for short_id, file_id in pairs
+            if _short_id_cache.get(short_id) != file_id
+        }
+        if not pending:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        ops = [
+            UpdateOne(
+                {'short_id': short_id},
+                {'$set': {'file_id': file_id, 'created_at': now}},
+                upsert=True
+            )
+            for short_id, file_id in pending.items()
+        ]
+        try:
+            await self.id_mappings.bulk_write(ops, ordered=False)
+        except Exception as e:
+            logger.error(f"Error bulk caching short ID mappings: {e}")
+            return 0
+        _short_id_cache.update(pending)
+        return len(ops)
+
+    @staticmethod
+    def _build_cache_update(file_data: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
+        """Normalize file data and build its upsert document, or None if invalid"""
+        # Ensure required fields
+        required_fields = ['file_id', 'file_unique_id', 'file_name', 'channel_id', 'message_id']
+        if not all(field in file_data for field in required_fields):
+            logger.error(f"Missing required fields in file_data: {file_data}")
+            return None
+
+        # Convert channel_id and message_id to int
+        file_data['channel_id'] = int(file_data['channel_id'])
+        file_data['message_id'] = int(file_data['message_id'])
+
+        # Lowercased copy lets prefix searches use an anchored, indexed regex
+        file_data['file_name_lower'] = file_data['file_name'].lower()
+        # Stored alongside the file so a download resolves its short ID in one query
+        file_data['short_id'] = make_short_id(file_data['file_id'])
+
+        return {
+            '$set': {
+                **file_data,
+                'last_updated': now
+            },
+            '$setOnInsert': {
+                'access_count': 0,
+                'first_seen': now
+            }
+        }
+
     async def cache_file(self, file_data: Dict[str, Any]) -> bool:
         """Cache file information"""
         try:
-            # Ensure required fields
-            required_fields = ['file_id', 'file_unique_id', 'file_name', 'channel_id', 'message_id']
-            if not all(field in file_data for field in required_fields):
-                logger.error(f"Missing required fields in file_data: {file_data}")
+            update = self._build_cache_update(file_data, datetime.now(timezone.utc))
+            if update is None:
                 return False
 
-            # Convert channel_id and message_id to int
-            if 'channel_id' in file_data:
-                file_data['channel_id'] = int(file_data['channel_id'])
-            if 'message_id' in file_data:
-                file_data['message_id'] = int(file_data['message_id'])
-
             await self.collection.update_one(
                 {'file_id': file_data['file_id']},
-                {
-                    '$set': {
-                        **file_data,
-                        'last_updated': datetime.now()
-                    },
-                    '$setOnInsert': {
-                        'access_count': 0,
-                        'first_seen': datetime.now()
-                    }
-                },
+                update,
                 upsert=True
             )
+            # The doc may now point at a new channel/message
+            _evict_cached_file(file_data['file_id'])
             return True
         except Exception as e:
             logger.error(f"Error caching file: {e}")
             return False
 
-    async def get_cached_file(self, file_id: str) -> Optional[Dict[str, Any]]:
-        """Get file from cache"""
+    async def cache_files_bulk(self, files: List[Dict[str, Any]]) -> int:
+        """Cache many files in a single unordered bulk write, returning how many were queued"""
+        now = datetime.now(timezone.utc)
+        ops = []
+        file_ids = []
+        for file_data in files:
+            try:
+                update = self._build_cache_update(file_data, now)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Invalid file data {file_data}: {e}")
+                continue
+            if update is not None:
+                ops.append(UpdateOne({'file_id': file_data['file_id']}, update, upsert=True))
+                file_ids.append(file_data['file_id'])
+
+        if not ops:
+            return 0
+
+        try:
+            await self.collection.bulk_write(ops, ordered=False)
+            return len(ops)
+        except Exception as e:
+            logger.error(f"Error bulk caching files: {e}")
+            return 0
+        finally:
+            # Unordered writes may land partially, so evict whatever the outcome
+            for file_id in file_ids:
+                _evict_cached_file(file_id)
+
+    async def _read_cached_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached file doc without recording an access"""
+        cached = _file_doc_cache.get(file_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             file_data = await self.collection.find_one({'file_id': file_id})
-            if file_data:
-                await self.collection.update_one(
-                    {'file_id': file_id},
-                    {
-                        '$set': {'last_accessed': datetime.now()},
-                        '$inc': {'access_count': 1}
-                    }
-                )
-            return file_data
         except Exception:
             return None
 
+        if file_data:
+            _file_doc_cache[file_id] = dict(file_data)
+        return file_data
+
+    async def get_cached_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get file from cache; access stats are recorded for the next batched flush"""
+        file_data = await self._read_cached_file(file_id)
+        if file_data:
+            await self.increment_access_count(file_id)
+        return file_data
+
+    async def get_cached_files_bulk(self, file_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch many cached files at once, keyed by file ID.
+
+        Unlike get_cached_file this is a plain read for listing results, so no
+        access is recorded.
+        """
+        found = {fid: dict(_file_doc_cache[fid]) for fid in file_ids if fid in _file_doc_cache}
+        missing = [fid for fid in file_ids if fid not in found]
+        if not missing:
+            return found
+
+        try:
+            async for file_data in self.collection.find({'file_id': {'$in': missing}}):
+                _file_doc_cache[file_data['file_id']] = dict(file_data)
+                found[file_data['file_id']] = file_data
+        except Exception as e:
+            logger.error(f"Error bulk retrieving cached files: {e}")
+        return found
+
+    async def get_cached_file_by_short_id(self, short_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a short ID straight to its cached file document.
+
+        This is a read only; callers record the access once the file is delivered.
+        """
+        file_id = _short_id_cache.get(short_id)
+        if file_id is not None:
+            return await self._read_cached_file(file_id)
+
+        try:
+            file_data = await self.collection.find_one({'short_id': short_id})
+        except Exception as e:
+            logger.error(f"Error retrieving file by short ID: {e}")
+            return None
+
+        if file_data:
+            _short_id_cache[short_id] = file_data['file_id']
+            _file_doc_cache[file_data['file_id']] = dict(file_data)
+            return file_data
+
+        # Files cached before short IDs were stored on them
+        file_id = await self.get_file_id_from_short_id(short_id)
+        if file_id is None:
+            return None
+        return await self._read_cached_file(file_id)
+
     async def search_cached_files(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Search through cached files"""
+        """
+        Search through cached files.
+
+        Prefix matches come from an anchored regex on the indexed
+        file_name_lower field; any remaining slots are filled from the
+        file_name text index, which matches whole words anywhere in the name.
+        """
         try:
             cursor = self.collection.find(
                 {
-                    'file_name': {'$regex': query, '$options': 'i'}
-                }
+                    'file_name_lower': {'$regex': f'^{re.escape(query.lower())}'}
+                },
+                projection=_SEARCH_PROJECTION
             ).sort('access_count', -1).limit(limit)
-            
-            return await cursor.to_list(length=limit)
-        except Exception:
-            return []
+            results = await cursor.to_list(length=limit)
+        except Exception as e:
+            logger.error(f"Error in prefix file search: {e}")
+            results = []
+
+        remaining = limit - len(results)
+        terms = _text_search_terms(query)
+        if remaining <= 0 or not terms:
+            return results
+
+        # Separate guard: a missing or still-building text index keeps the prefix hits
+        try:
+            cursor = self.collection.find(
+                {
+                    '$text': {'$search': terms},
+                    'file_id': {'$nin': [doc['file_id'] for doc in results]}
+                },
+                projection=_SEARCH_PROJECTION
+            ).sort('access_count', -1).limit(remaining)
+            results.extend(await cursor.to_list(length=remaining))
+        except Exception as e:
+            logger.error(f"Error in text file search: {e}")
+        return results
 
     async def clean_old_cache(self, days: int = 30) -> int:
         """Clean cache older than specified days"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
             result = await self.collection.delete_many(
                 {'last_accessed': {'$lt': cutoff_date}}
             )
@@ -211,7 +432,9 @@ class FileCache:
     async def get_popular_files(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most accessed files"""
         try:
-            cursor = self.collection.find().sort('access_count', -1).limit(limit)
+            cursor = self.collection.find(
+                {}, projection=_POPULAR_PROJECTION
+            ).sort('access_count', -1).limit(limit)
             return await cursor.to_list(length=limit)
         except Exception:
             return []
@@ -1,11 +1,25 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from ..config.config import Config
-from datetime import datetime
+from datetime import datetime, timezone
 
 class Database:
-    def __init__(self):
-        self.client = AsyncIOMotorClient(Config.DB_URL)
-        self._db: AsyncIOMotorDatabase = self.client.shadowfinder
+    """Process-wide database handle sharing a single Motor client and pool"""
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance.client = AsyncIOMotorClient(
+                Config.DB_URL,
+                minPoolSize=Config.WORKERS,
+                maxIdleTimeMS=60000,
+                serverSelectionTimeoutMS=3000,
+                # Stored dates come back UTC-aware, matching datetime.now(timezone.utc)
+                tz_aware=True
+            )
+            instance._db = instance.client.shadowfinder
+            cls._instance = instance
+        return cls._instance
 
     @property
     def db(self) -> AsyncIOMotorDatabase:
@@ -16,20 +30,22 @@ class Database:
         return self._db[name]
 
     async def close(self):
-        """Close database connection"""
+        """Close the shared database connection"""
         self.client.close()
+        Database._instance = None
 
     async def add_user(self, user_id: int):
         """Add user to database"""
+        now = datetime.now(timezone.utc)
         await self.db.users.update_one(
             {'user_id': user_id},
             {
                 '$set': {
                     'user_id': user_id,
-                    'last_used': datetime.now()
+                    'last_used': now
                 },
                 '$setOnInsert': {
-                    'joined_date': datetime.now()
+                    'joined_date': now
                 }
             },
             upsert=True
@@ -49,5 +65,5 @@ class Database:
         """Update user's last usage time"""
         await self.db.users.update_one(
             {'user_id': user_id},
-            {'$set': {'last_used': datetime.now()}}
+            {'$set': {'last_used': datetime.now(timezone.utc)}}
         )
@@ -11,26 +11,35 @@ from .admin import (
 )
 from ..config.config import Config
 
+# Shared filter nodes, built once at import instead of per registration
+_PRIVATE = filters.private
+_GROUP = filters.group
+_OWNER = filters.user(Config.OWNER_ID)
+_NON_CMD_PRIVATE = _PRIVATE & ~filters.command([
+    "start", "help", "about", "stats", "admin", "panel",
+    "channels", "checkid", "checkconfig"
+])
+
 def register_all_handlers(app: Client) -> None:
     """Register all handlers with the application"""
     
     # Commands
-    app.add_handler(MessageHandler(start_command, filters.command("start") & filters.private))
+    app.add_handler(MessageHandler(start_command, filters.command("start") & _PRIVATE))
     app.add_handler(MessageHandler(help_command, filters.command("help")))
     app.add_handler(MessageHandler(about_command, filters.command("about")))
     
     # Admin commands
-    app.add_handler(MessageHandler(admin_panel, filters.command(["admin", "panel"]) & filters.private))
-    app.add_handler(MessageHandler(ban_user, filters.command("ban") & filters.group))
-    app.add_handler(MessageHandler(unban_user, filters.command("unban") & filters.group))
-    app.add_handler(MessageHandler(broadcast, filters.command("broadcast") & filters.user(Config.OWNER_ID)))
-    app.add_handler(MessageHandler(user_stats, filters.command("stats") & filters.private))
-    app.add_handler(MessageHandler(list_channels, filters.command("channels") & filters.private))
-    app.add_handler(MessageHandler(restart_bot, filters.command("restart") & filters.private))
-    app.add_handler(MessageHandler(check_id, filters.command("checkid") & filters.private))
-    app.add_handler(MessageHandler(check_config, filters.command("checkconfig") & filters.private))  # Add checkconfig command
+    app.add_handler(MessageHandler(admin_panel, filters.command(["admin", "panel"]) & _PRIVATE))
+    app.add_handler(MessageHandler(ban_user, filters.command("ban") & _GROUP))
+    app.add_handler(MessageHandler(unban_user, filters.command("unban") & _GROUP))
+    app.add_handler(MessageHandler(broadcast, filters.command("broadcast") & _OWNER))
+    app.add_handler(MessageHandler(user_stats, filters.command("stats") & _PRIVATE))
+    app.add_handler(MessageHandler(list_channels, filters.command("channels") & _PRIVATE))
+    app.add_handler(MessageHandler(restart_bot, filters.command("restart") & _PRIVATE))
+    app.add_handler(MessageHandler(check_id, filters.command("checkid") & _PRIVATE))
+    app.add_handler(MessageHandler(check_config, filters.command("checkconfig") & _PRIVATE))
     app.add_handler(MessageHandler(add_authorized_channel, filters.command(["addchannel", "addgroup"])))
-    app.add_handler(MessageHandler(add_admin, filters.command(["addadmin"]) & filters.user(Config.OWNER_ID)))
+    app.add_handler(MessageHandler(add_admin, filters.command(["addadmin"]) & _OWNER))
 
     
     # Inline
@@ -40,9 +49,4 @@ def register_all_handlers(app: Client) -> None:
     app.add_handler(CallbackQueryHandler(handle_callback))
     
     # Private Messages - Regular messages in private chat that are not commands
-    app.add_handler(MessageHandler(
-        handle_private_messages,
-        filters.private & ~filters.command("start") & ~filters.command("help") & 
-        ~filters.command("about") & ~filters.command("stats") & ~filters.command(["admin", "panel"]) &
-        ~filters.command("channels") & ~filters.command("checkid") & ~filters.command("checkconfig")  # Add checkconfig to excluded commands
-    ))
\ No newline at end of file
+    app.add_handler(MessageHandler(handle_private_messages, _NON_CMD_PRIVATE))
\ No newline at end of file
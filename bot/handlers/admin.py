@@ -1,15 +1,20 @@
 # bot/handlers/admin.py
-import json 
 import os
 import sys
-from pyrogram import Client, filters, enums
+import time
+import orjson
+from functools import lru_cache
+from pyrogram import Client, filters, enums, errors
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton
 from ..database import Database, User, FileCache
 from ..templates.messages import Messages
 from ..config.config import Config
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 import asyncio
 from ..helpers.decorators import force_subscribe
+from ..helpers.utils import batched_user_ids, gather_bounded, get_user_cached, send_log
+from ..helpers.ttl_cache import async_ttl_cache
 from loguru import logger
 from motor.motor_asyncio import  AsyncIOMotorDatabase
 
@@ -17,23 +22,88 @@ db = Database()
 user_model = User(db.db)
 file_cache = FileCache(db.db)
 
+# Stats are fine slightly stale; share one computation per window
+_STATS_TTL = 30
+
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Broadcast sends run concurrently, bounded to stay under Telegram's flood limits
+BROADCAST_CONCURRENCY = 20
+BROADCAST_BATCH_SIZE = 500
+# user_id-only documents are tiny, so fetch several send waves per getMore
+BROADCAST_CURSOR_BATCH = 1000
+BROADCAST_STATUS_INTERVAL = 3  # seconds between progress edits
+BROADCAST_LOCK = asyncio.Lock()
+
+# Static keyboards, built once at import
+ADMIN_MENU_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("👥 Users", callback_data="admin_users"),
+        InlineKeyboardButton("🚫 Banned", callback_data="admin_banned")
+    ],
+    [
+        InlineKeyboardButton("📊 Statistics", callback_data="admin_stats"),
+        InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
+    ],
+    [
+        InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
+        InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings")
+    ]
+])
+CHANNELS_REFRESH_KB = InlineKeyboardMarkup([[
+    InlineKeyboardButton("🔄 Refresh", callback_data="refresh_channels")
+]])
+
+@lru_cache(maxsize=1024)
 def is_admin_or_owner(user_id: int) -> bool:
-    """Check if user is admin or owner"""
+    """Check if user is admin or owner (call cache_clear() after editing ADMIN_IDS)"""
     return user_id == Config.OWNER_ID or user_id in Config.ADMIN_IDS
 
-async def get_bot_stats(db: AsyncIOMotorDatabase):
-    """Get overall bot statistics"""
-    user_model = User(db)
-    file_cache = FileCache(db)
-    
-    total_users = await user_model.collection.count_documents({})
-    banned_users = await user_model.collection.count_documents({'banned': True})
-    total_files = await file_cache.collection.count_documents({})
-    
-    total_downloads = await file_cache.collection.aggregate([
-        {'$group': {'_id': None, 'total': {'$sum': '$access_count'}}}
-    ]).to_list(1)
-    
+@lru_cache(maxsize=1)
+def settings_overview_text() -> str:
+    """Settings summary (call cache_clear() after changing a Config value)"""
+    return (
+        "⚙️ **Bot Settings**\n\n"
+        f"**General Settings:**\n"
+        f"• Workers: {Config.WORKERS}\n"
+        f"• Max Concurrent: {Config.MAX_CONCURRENT_TRANSMISSIONS}\n\n"
+        f"**Search Settings:**\n"
+        f"• Min Search Length: {Config.MIN_SEARCH_LENGTH}\n"
+        f"• Max Results: {Config.MAX_RESULTS}\n\n"
+        f"**File Settings:**\n"
+        f"• Delete Timeout: {Config.DELETE_TIMEOUT}s\n"
+        f"• Cache Cleanup: {Config.CACHE_CLEANUP_DAYS} days\n\n"
+        f"**Channel Settings:**\n"
+        f"• Force Sub: {'✅' if Config.FORCE_SUB_CHANNEL else '❌'}\n"
+        f"• Log Channel: {'✅' if Config.LOG_CHANNEL else '❌'}"
+    )
+
+@async_ttl_cache(_STATS_TTL, key=lambda db=None: "bot_stats")
+async def get_bot_stats(db: Optional[AsyncIOMotorDatabase] = None):
+    """
+    Get overall bot statistics.
+
+    Unfiltered totals come from estimated_document_count, which reads
+    collection metadata instead of scanning; they can briefly lag behind
+    concurrent writes (or after an unclean shutdown), which is fine for
+    display. The banned count is filtered and served by the banned index.
+    Results are cached for _STATS_TTL seconds and concurrent callers share
+    a single refresh. Queries go through the module-level models on the
+    shared Database client; db is accepted for existing callers.
+    """
+    total_users, banned_users, total_files, total_downloads = await asyncio.gather(
+        user_model.collection.estimated_document_count(),
+        user_model.collection.count_documents({'banned': True}),
+        file_cache.collection.estimated_document_count(),
+        # Zero counts don't change the sum; the range match lets the planner
+        # answer from the access_count index without fetching documents
+        file_cache.collection.aggregate([
+            {'$match': {'access_count': {'$gt': 0}}},
+            {'$project': {'access_count': 1, '_id': 0}},
+            {'$group': {'_id': None, 'total': {'$sum': '$access_count'}}}
+        ]).to_list(1)
+    )
+
     return {
         'total_users': total_users,
         'banned_users': banned_users,
@@ -52,28 +122,13 @@ async def admin_panel(client: Client, message: Message):
     
     stats = await get_bot_stats(client.db)  # Pass the database instance
     
-    buttons = [
-        [
-            InlineKeyboardButton("👥 Users", callback_data="admin_users"),
-            InlineKeyboardButton("🚫 Banned", callback_data="admin_banned")
-        ],
-        [
-            InlineKeyboardButton("📊 Statistics", callback_data="admin_stats"),
-            InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
-        ],
-        [
-            InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
-            InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings")
-        ]
-    ]
-    
     await message.reply_text(
         f"⚔️ **Shadow Monarch's Admin Panel** ⚔️\n\n"
         f"👥 Total Users: {stats['total_users']}\n"
         f"🚫 Banned Users: {stats['banned_users']}\n"
         f"📁 Cached Files: {stats['total_files']}\n"
         f"📥 Total Downloads: {stats['total_downloads']}\n",
-        reply_markup=InlineKeyboardMarkup(buttons)
+        reply_markup=ADMIN_MENU_KB
     )
 
 @Client.on_message(filters.command(["ban"]) & filters.group)
@@ -122,42 +177,45 @@ async def ban_user(client: Client, message: Message):
             "banned": True,
             "ban_reason": reason,
             "banned_by": message.from_user.id,
-            "ban_date": datetime.now()
+            "ban_date": datetime.now(timezone.utc)
         }
-        await user_model.ban_user(user_id, ban_data)
-        
-        user = await client.get_users(user_id)
+        user, _ = await asyncio.gather(
+            get_user_cached(client, user_id),
+            user_model.ban_user(user_id, ban_data)
+        )
+        get_bot_stats.cache_clear()
         
         # Log the ban
-        log_text = f"""
-🚫 **User Banned**
-👤 **User**: {user.mention} [`{user.id}`]
-👮 **Admin**: {message.from_user.mention}
-📝 **Reason**: {reason}
-⏰ **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        if Config.LOG_CHANNEL:
-            await client.send_message(Config.LOG_CHANNEL, log_text)
+        log_text = Messages.BAN_LOG.format_map({
+            'mention': user.mention,
+            'user_id': user.id,
+            'admin': message.from_user.mention,
+            'reason': reason,
+            'date': ban_data['ban_date'].strftime(LOG_DATE_FORMAT)
+        })
+        send_log(client, log_text)
         
-        await message.reply_text(
-            Messages.BANNED_USER.format(
-                mention=user.mention,
-                user_id=user_id,
-                admin_mention=message.from_user.mention,
-                reason=reason
-            )
-        )
-        
-        # Notify user
-        try:
-            await client.send_message(
+        # Reply to the admin and notify the user concurrently; the user may
+        # have blocked the bot, so that send is allowed to fail
+        reply_result, _ = await asyncio.gather(
+            message.reply_text(
+                Messages.BANNED_USER.format(
+                    mention=user.mention,
+                    user_id=user_id,
+                    admin_mention=message.from_user.mention,
+                    reason=reason
+                )
+            ),
+            client.send_message(
                 user_id,
                 f"⚠️ You have been banned from using ShadowFinder!\n"
                 f"📝 **Reason**: {reason}\n"
                 f"👮 **Admin**: {message.from_user.mention}"
-            )
-        except Exception:
-            pass
+            ),
+            return_exceptions=True
+        )
+        if isinstance(reply_result, Exception):
+            raise reply_result
 
     except Exception as e:
         await message.reply_text(f"❌ Error: {str(e)}")
@@ -197,18 +255,18 @@ async def unban_user(client: Client, message: Message):
 
         # Unban user
         await user_model.ban_user(user_id, {"banned": False})
+        get_bot_stats.cache_clear()
         
-        user = await client.get_users(user_id)
+        user = await get_user_cached(client, user_id)
         
         # Log the unban
-        log_text = f"""
-✅ **User Unbanned**
-👤 **User**: {user.mention} [`{user.id}`]
-👮 **Admin**: {message.from_user.mention}
-⏰ **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        if Config.LOG_CHANNEL:
-            await client.send_message(Config.LOG_CHANNEL, log_text)
+        log_text = Messages.UNBAN_LOG.format_map({
+            'mention': user.mention,
+            'user_id': user.id,
+            'admin': message.from_user.mention,
+            'date': datetime.now(timezone.utc).strftime(LOG_DATE_FORMAT)
+        })
+        send_log(client, log_text)
         
         await message.reply_text(
             Messages.UNBANNED_USER.format(
@@ -261,22 +319,22 @@ async def add_admin(client: Client, message: Message):
             return
 
         # Get user details
-        user = await client.get_users(user_id)
+        user = await get_user_cached(client, user_id)
 
-        # Update admin list 
-        # Note: This is a runtime update. You'll need to modify your config file 
-        # or have a mechanism to persist these changes between bot restarts
-        Config.ADMIN_IDS.append(user_id)
+        # Update admin list
+        # Note: unlike /addchannel and /addgroup this is runtime only; admins are not
+        # stored in the database and reset to ADMIN_IDS from the config on restart
+        Config.ADMIN_IDS.add(user_id)
+        is_admin_or_owner.cache_clear()
 
         # Log the admin addition
-        log_text = f"""
-🆕 **New Admin Added**
-👤 **Admin**: {user.mention} [`{user.id}`]
-👮 **Added by**: {message.from_user.mention}
-⏰ **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        if Config.LOG_CHANNEL:
-            await client.send_message(Config.LOG_CHANNEL, log_text)
+        log_text = Messages.ADMIN_ADDED_LOG.format_map({
+            'mention': user.mention,
+            'user_id': user.id,
+            'admin': message.from_user.mention,
+            'date': datetime.now(timezone.utc).strftime(LOG_DATE_FORMAT)
+        })
+        send_log(client, log_text)
         
         await message.reply_text(
             f"✅ **{user.mention}** has been added as an admin!\n"
@@ -315,19 +373,18 @@ async def add_authorized_channel(client: Client, message: Message):
     try:
         # Get channel/group ID
         if message.reply_to_message and message.reply_to_message.forward_from_chat:
-            chat_id = message.reply_to_message.forward_from_chat.id
+            chat = message.reply_to_message.forward_from_chat
         else:
             # Try to get chat ID from username or ID
             input_chat = message.command[1]
             try:
                 chat = await client.get_chat(input_chat)
-                chat_id = chat.id
             except Exception as e:
                 await message.reply_text(f"❌ Error getting chat: {str(e)}")
                 return
+        chat_id = chat.id
 
         # Determine chat type
-        chat = await client.get_chat(chat_id)
         is_channel = chat.type in [enums.ChatType.CHANNEL]
         is_group = chat.type in [enums.ChatType.SUPERGROUP, enums.ChatType.GROUP]
 
@@ -347,27 +404,36 @@ async def add_authorized_channel(client: Client, message: Message):
                 return
             Config.SEARCH_CHANNELS.append(chat_id)
             list_name = "Search Channels"
+            settings_key = 'extra_search_channels'
         else:
             if chat_id in Config.AUTHORIZED_GROUPS:
                 await message.reply_text("⚠️ Group already in authorized groups!")
                 return
-            Config.AUTHORIZED_GROUPS.append(chat_id)
+            Config.AUTHORIZED_GROUPS.add(chat_id)
             list_name = "Authorized Groups"
+            settings_key = 'extra_authorized_groups'
+
+        # Persist so the chat survives restarts; loaded in ShadowFinder.load_persisted_chats
+        await client.db.settings.update_one(
+            {'key': settings_key},
+            {'$addToSet': {'value': chat_id}},
+            upsert=True
+        )
 
         # Log the addition
-        log_text = f"""
-🆕 **{list_name} Added**
-📍 **Chat**: {chat.title} [`{chat_id}`]
-👮 **Added by**: {message.from_user.mention}
-⏰ **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        if Config.LOG_CHANNEL:
-            await client.send_message(Config.LOG_CHANNEL, log_text)
+        log_text = Messages.CHAT_ADDED_LOG.format_map({
+            'list_name': list_name,
+            'title': chat.title,
+            'chat_id': chat_id,
+            'admin': message.from_user.mention,
+            'date': datetime.now(timezone.utc).strftime(LOG_DATE_FORMAT)
+        })
+        send_log(client, log_text)
         
         await message.reply_text(
             f"✅ **{chat.title}** has been added to {list_name}!\n"
             f"👥 Chat ID: `{chat_id}`\n\n"
-            "⚠️ Note: This is a runtime update. Persist changes in your config file."
+            "💾 Saved to the database; it will be kept across restarts."
         )
 
     except Exception as e:
@@ -385,7 +451,17 @@ async def broadcast(client: Client, message: Message):
         )
         return
 
-    status_msg = await message.reply_text(Messages.BROADCAST_STARTED)
+    # Overlapping broadcasts would double the send rate into flood limits
+    if BROADCAST_LOCK.locked():
+        await message.reply_text(Messages.BROADCAST_RUNNING)
+        return
+
+    async with BROADCAST_LOCK:
+        await _run_broadcast(client, message)
+
+async def _run_broadcast(client: Client, message: Message):
+    """Send the broadcast and report progress"""
+    status_msg = await message.reply_text(Messages.BROADCAST_START)
     
     broadcast_msg = (
         message.text.split(None, 1)[1]
@@ -393,37 +469,61 @@ async def broadcast(client: Client, message: Message):
         else message.reply_to_message.text
     )
 
+    text = f"📢 **Broadcast Message**\n\n{broadcast_msg}"
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def send_one(user_id: int) -> bool:
+        async with semaphore:
+            try:
+                try:
+                    await client.send_message(user_id, text)
+                except errors.FloodWait as e:
+                    await asyncio.sleep(e.value)
+                    await client.send_message(user_id, text)
+                return True
+            except Exception as e:
+                # One bad recipient must not abort the rest of the broadcast
+                logger.error(f"Broadcast failed for user {user_id}: {e}")
+                return False
+
     total_users = 0
     success = 0
     failed = 0
-    
-    async with asyncio.Lock():
-        async for user in db.users.find({'banned': False}):
-            total_users += 1
-            try:
-                await client.send_message(
-                    user['user_id'],
-                    f"📢 **Broadcast Message**\n\n{broadcast_msg}"
-                )
-                success += 1
-                await asyncio.sleep(0.1)  # Prevent flooding
-            except Exception:
-                failed += 1
-
-            if total_users % 20 == 0:  # Update status every 20 users
-                await status_msg.edit_text(
-                    f"🔄 Broadcasting...\n"
-                    f"👥 Progress: {total_users}\n"
-                    f"✅ Success: {success}\n"
-                    f"❌ Failed: {failed}"
-                )
+    last_edit = time.monotonic()
+
+    async def send_batch(user_ids: list) -> None:
+        nonlocal total_users, success, failed, last_edit
+        results = await asyncio.gather(*(send_one(uid) for uid in user_ids))
+        sent = sum(results)
+        total_users += len(results)
+        success += sent
+        failed += len(results) - sent
+
+        # Status edits share the flood budget with the broadcast itself
+        if time.monotonic() - last_edit < BROADCAST_STATUS_INTERVAL:
+            return
+        try:
+            await status_msg.edit_text(
+                f"🔄 Broadcasting...\n"
+                f"👥 Progress: {total_users}\n"
+                f"✅ Success: {success}\n"
+                f"❌ Failed: {failed}"
+            )
+        except errors.MessageNotModified:
+            pass
+        except errors.RPCError as e:
+            # Progress is cosmetic; never let it stop delivery
+            logger.warning(f"Could not update broadcast status: {e}")
+        last_edit = time.monotonic()
+
+    cursor = db.db.users.find(
+        {'banned': False}, {'user_id': 1, '_id': 0}
+    ).batch_size(BROADCAST_CURSOR_BATCH)
+    async for batch in batched_user_ids(cursor, BROADCAST_BATCH_SIZE):
+        await send_batch(batch)
 
     await status_msg.edit_text(
-        Messages.BROADCAST_DONE.format(
-            total=total_users,
-            success=success,
-            failed=failed
-        )
+        Messages.BROADCAST_COMPLETE.format(success, failed, total_users)
     )
 
 @Client.on_message(filters.command(["restart"]) & filters.private)
@@ -437,11 +537,11 @@ async def restart_bot(client: Client, message: Message):
 
     try:
         # Log the restart
-        log_text = f"""
-🔄 **Bot Restart Initiated**
-👤 **Triggered By**: {message.from_user.mention}
-⏰ **Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+        restart_time = datetime.now(timezone.utc).strftime(LOG_DATE_FORMAT)
+        log_text = Messages.RESTART_LOG.format_map({
+            'admin': message.from_user.mention,
+            'date': restart_time
+        })
         if Config.LOG_CHANNEL:
             await client.send_message(Config.LOG_CHANNEL, log_text)
 
@@ -458,12 +558,17 @@ async def restart_bot(client: Client, message: Message):
         restart_info = {
             "chat_id": message.chat.id,
             "message_id": restart_msg.id,
-            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            "time": restart_time
         }
         
         # Save restart info to file
-        with open("restart.json", "w") as f:
-            json.dump(restart_info, f)
+        # One write of pre-encoded bytes, flushed to disk before execv
+        fd = os.open("restart.json", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, orjson.dumps(restart_info))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
         # Trigger graceful shutdown with restart flag
         os.environ['BOT_RESTARTING'] = '1'
@@ -482,6 +587,40 @@ async def restart_bot(client: Client, message: Message):
         await restart_msg.edit_text(f"❌ **Error during restart**\n\n`{str(e)}`")
 
 
+async def render_channels_text(client: Client) -> str:
+    """Describe every configured search channel, looking them up concurrently"""
+    async def lookup(channel_id):
+        return await asyncio.gather(
+            client.get_chat(channel_id),
+            client.get_chat_members_count(channel_id),
+            return_exceptions=True
+        )
+
+    lookups = await gather_bounded(lookup(channel_id) for channel_id in Config.SEARCH_CHANNELS)
+
+    text_parts = ["📑 **Configured Search Channels:**\n\n"]
+    for channel_id, (chat, member_count) in zip(Config.SEARCH_CHANNELS, lookups):
+        error = next((r for r in (chat, member_count) if isinstance(r, BaseException)), None)
+        if error is not None:
+            text_parts.append(f"• **Channel ID**: `{channel_id}`\n  └ Error: `{str(error)}`\n\n")
+            continue
+        chat_type = "Channel" if chat.type == enums.ChatType.CHANNEL else "Group"
+        text_parts.append(
+            f"• **{chat.title}**\n"
+            f"  ├ **ID**: `{channel_id}`\n"
+            f"  ├ **Type**: `{chat_type}`\n"
+            f"  ├ **Members**: `{member_count}`\n"
+            f"  └ **Username**: @{chat.username if chat.username else 'Private'}\n\n"
+        )
+
+    if not Config.SEARCH_CHANNELS:
+        text_parts.append("❌ No channels configured for search!")
+
+    # Add total count footer
+    text_parts.append(f"\n**Total Configured Channels**: `{len(Config.SEARCH_CHANNELS)}`")
+    return "".join(text_parts)
+
+
 @Client.on_message(filters.command(["channels"]) & filters.private)
 async def list_channels(client: Client, message: Message):
     """List all channels configured for file search"""
@@ -490,37 +629,11 @@ async def list_channels(client: Client, message: Message):
             await message.reply_text(Messages.NOT_AUTHORIZED)
             return
 
-        channels_text = "📑 **Configured Search Channels:**\n\n"
-        
-        for channel_id in Config.SEARCH_CHANNELS:
-            try:
-                chat = await client.get_chat(channel_id)
-                chat_type = "Channel" if chat.type == enums.ChatType.CHANNEL else "Group"
-                member_count = await client.get_chat_members_count(channel_id)
-                channels_text += (
-                    f"• **{chat.title}**\n"
-                    f"  ├ **ID**: `{channel_id}`\n"
-                    f"  ├ **Type**: `{chat_type}`\n"
-                    f"  ├ **Members**: `{member_count}`\n"
-                    f"  └ **Username**: @{chat.username if chat.username else 'Private'}\n\n"
-                )
-            except Exception as e:
-                channels_text += f"• **Channel ID**: `{channel_id}`\n  └ Error: `{str(e)}`\n\n"
-
-        if not Config.SEARCH_CHANNELS:
-            channels_text += "❌ No channels configured for search!"
+        channels_text = await render_channels_text(client)
 
-        # Add total count footer
-        channels_text += f"\n**Total Configured Channels**: `{len(Config.SEARCH_CHANNELS)}`"
-        
-        # Add refresh button
-        buttons = [[
-            InlineKeyboardButton("🔄 Refresh", callback_data="refresh_channels")
-        ]]
-        
         await message.reply_text(
             channels_text,
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=CHANNELS_REFRESH_KB
         )
 
     except Exception as e:
@@ -533,10 +646,6 @@ async def list_channels(client: Client, message: Message):
 @force_subscribe
 async def user_stats(client: Client, message: Message):
     """Get user statistics"""
-    # Initialize database and models
-    db_instance = Database()
-    user_model = User(db_instance.db)
-    
     user_data = await user_model.get_user(message.from_user.id)
     if not user_data:
         await message.reply_text(Messages.USER_NOT_FOUND)
@@ -562,9 +671,6 @@ async def user_stats(client: Client, message: Message):
             last_active=user_data['last_used'].strftime("%Y-%m-%d %H:%M:%S")
         ) + admin_stats
     )
-    
-    # Close database connection when done
-    await db_instance.close()
 
 @Client.on_message(filters.command(["checkid"]) & (filters.private | filters.group))
 async def check_id(client: Client, message: Message):
@@ -588,7 +694,7 @@ async def check_id(client: Client, message: Message):
             return
         
         try:
-            bot_member = await client.get_chat_member(chat.id, (await client.get_me()).id)
+            bot_member = await client.get_chat_member(chat.id, (await client.get_bot_user()).id)
             member_count = await client.get_chat_members_count(chat.id)
             
             # Check chat type
@@ -673,33 +779,39 @@ async def check_config(client: Client, message: Message):
             return
 
         config_text = "📝 **Bot Configuration**\n\n"
-        
+
+        # Resolve every configured chat concurrently
+        groups = list(Config.AUTHORIZED_GROUPS)
+        channels = list(Config.SEARCH_CHANNELS)
+        force_sub = [Config.FORCE_SUB_CHANNEL] if Config.FORCE_SUB_CHANNEL else []
+        chats = await gather_bounded(client.get_chat(chat_id) for chat_id in groups + channels + force_sub)
+        group_chats = chats[:len(groups)]
+        channel_chats = chats[len(groups):len(groups) + len(channels)]
+        force_sub_chats = chats[len(groups) + len(channels):]
+
         # Check Authorized Groups
         config_text += "🛡️ **Authorized Groups**:\n"
-        for group_id in Config.AUTHORIZED_GROUPS:
-            try:
-                chat = await client.get_chat(group_id)
+        for group_id, chat in zip(groups, group_chats):
+            if isinstance(chat, Exception):
+                config_text += f"❌ Error with ID {group_id}: {str(chat)}\n"
+            else:
                 config_text += f"✅ {chat.title} (`{group_id}`)\n"
-            except Exception as e:
-                config_text += f"❌ Error with ID {group_id}: {str(e)}\n"
         
         # Check Search Channels
         config_text += "\n🔍 **Search Channels**:\n"
-        for channel_id in Config.SEARCH_CHANNELS:
-            try:
-                chat = await client.get_chat(channel_id)
+        for channel_id, chat in zip(channels, channel_chats):
+            if isinstance(chat, Exception):
+                config_text += f"❌ Error with ID {channel_id}: {str(chat)}\n"
+            else:
                 config_text += f"✅ {chat.title} (`{channel_id}`)\n"
-            except Exception as e:
-                config_text += f"❌ Error with ID {channel_id}: {str(e)}\n"
         
         # Check Force Sub Channel
-        if Config.FORCE_SUB_CHANNEL:
+        for chat in force_sub_chats:
             config_text += "\n📢 **Force Sub Channel**:\n"
-            try:
-                chat = await client.get_chat(Config.FORCE_SUB_CHANNEL)
+            if isinstance(chat, Exception):
+                config_text += f"❌ Error: {str(chat)}\n"
+            else:
                 config_text += f"✅ {chat.title} (`{Config.FORCE_SUB_CHANNEL}`)\n"
-            except Exception as e:
-                config_text += f"❌ Error: {str(e)}\n"
 
         await message.reply_text(config_text)
         
@@ -707,18 +819,21 @@ async def check_config(client: Client, message: Message):
         logger.error(f"Error in config check: {e}")
         await message.reply_text(f"❌ Error checking config: {str(e)}")
 
-@Client.on_message(filters.private & filters.regex(r'^[^/]'))
+def _awaiting_setting(_, client: Client, message: Message) -> bool:
+    """Match only messages from users with a pending setting edit"""
+    states = getattr(client, 'user_states', None)
+    if not states or not message.from_user:
+        return False
+    user_state = states.get(message.from_user.id)
+    return bool(user_state) and user_state.get('state') == 'awaiting_setting'
+
+awaiting_setting = filters.create(_awaiting_setting)
+
+@Client.on_message(filters.private & awaiting_setting & filters.regex(r'^[^/]'))
 async def handle_setting_value(client: Client, message: Message):
     """Handle incoming setting values"""
     try:
-        # Check if user has a pending setting edit
-        if not hasattr(client, 'user_states'):
-            client.user_states = {}
-            
-        user_state = client.user_states.get(message.from_user.id)
-        if not user_state or user_state.get('state') != 'awaiting_setting':
-            return
-            
+        user_state = client.user_states[message.from_user.id]
         section = user_state['section']
         setting = user_state['setting']
         value = message.text.strip()
@@ -773,6 +888,7 @@ async def update_bot_setting(client: Client, section: str, setting: str, value:
             
         # Update config
         setattr(Config, setting_key, value)
+        settings_overview_text.cache_clear()
         
         # Save to database if needed
         if client.db:
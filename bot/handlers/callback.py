@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pyrogram import Client, errors
 from pyrogram.types import (
     CallbackQuery,
@@ -6,67 +6,144 @@ from pyrogram.types import (
     InlineKeyboardButton,
     Message
 )
-from bot.database.models import FileCache, User
-from bot.handlers.admin import get_bot_stats
-from ..helpers.utils import delete_message_later
+from bot.database.models import FileCache
+from bot.handlers.admin import (
+    CHANNELS_REFRESH_KB,
+    get_bot_stats,
+    is_admin_or_owner,
+    render_channels_text,
+    settings_overview_text
+)
+from ..helpers.utils import (
+    batched_user_ids,
+    delete_message_later,
+    edit_if_changed,
+    get_user_cached,
+    get_users_cached,
+    run_in_background,
+    send_log
+)
+from ..helpers.log_index import LogIndex
+from ..helpers.rate_limiter import TokenBucket
+from ..helpers.ttl_cache import async_ttl_cache
 from ..templates.messages import Messages
 from ..config.config import Config
 from pyrogram import enums
 from loguru import logger
 import asyncio
+import gzip
+import os
+import re
+import shutil
+import time
+
+# Static keyboards, built once instead of on every click
+BACK_TO_ADMIN_BUTTON = InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")
+BACK_TO_ADMIN = InlineKeyboardMarkup([[BACK_TO_ADMIN_BUTTON]])
+BACK_TO_USERS_BUTTON = InlineKeyboardButton("« Back to Users", callback_data="admin_users")
+BACK_TO_BANNED_BUTTON = InlineKeyboardButton("« Back to Banned Users", callback_data="admin_banned")
+BACK_TO_BANNED = InlineKeyboardMarkup([[BACK_TO_BANNED_BUTTON]])
+BACK_TO_SETTINGS_BUTTON = InlineKeyboardButton("« Back to Settings", callback_data="admin_settings")
+
+BROADCAST_MENU_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("All Users", callback_data="broadcast_all_users"),
+        InlineKeyboardButton("Active Users", callback_data="broadcast_active_users")
+    ],
+    [BACK_TO_ADMIN_BUTTON]
+])
+
+DETAILED_STATS_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📈 Usage Trends", callback_data="stats_trends"),
+        InlineKeyboardButton("📊 Daily Stats", callback_data="stats_daily")
+    ],
+    [BACK_TO_ADMIN_BUTTON]
+])
+
+SETTINGS_MENU_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🛠 General", callback_data="settings_section_general"),
+        InlineKeyboardButton("🔍 Search", callback_data="settings_section_search")
+    ],
+    [
+        InlineKeyboardButton("📁 Files", callback_data="settings_section_files"),
+        InlineKeyboardButton("📢 Channels", callback_data="settings_section_channels")
+    ],
+    [BACK_TO_ADMIN_BUTTON]
+])
+
+SETTINGS_VIEW_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔄 Update Settings", callback_data="admin_settings_edit"),
+        InlineKeyboardButton("📝 Edit Config", callback_data="admin_settings_config")
+    ],
+    [BACK_TO_ADMIN_BUTTON]
+])
+
+SETTINGS_EDIT_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("⚙️ General", callback_data="admin_settings_section_general"),
+        InlineKeyboardButton("🔍 Search", callback_data="admin_settings_section_search")
+    ],
+    [
+        InlineKeyboardButton("📁 Files", callback_data="admin_settings_section_files"),
+        InlineKeyboardButton("📢 Channels", callback_data="admin_settings_section_channels")
+    ],
+    [InlineKeyboardButton("« Back to Settings", callback_data="admin_settings_view")]
+])
+
+ADMIN_PANEL_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("👥 Users", callback_data="admin_users"),
+        InlineKeyboardButton("🚫 Banned", callback_data="admin_banned")
+    ],
+    [
+        InlineKeyboardButton("📊 Statistics", callback_data="admin_stats"),
+        InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
+    ],
+    [
+        InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
+        InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings")
+    ],
+    [
+        InlineKeyboardButton("🔄 Refresh Channels", callback_data="refresh_channels")
+    ]
+])
+
+LOG_LEVELS = ["ALL", "INFO", "WARNING", "ERROR"]
+# "time | LEVEL | name:function:line - message"
+LOG_LINE_RE = re.compile(r"^([^|]+)\|\s*(\w+)\s*\|\s*(.*)$")
+LEVEL_EMOJI = {"ERROR": "❌", "CRITICAL": "❌", "WARNING": "⚠️", "INFO": "ℹ️", "DEBUG": "🐛"}
+# Level filter row for each active level
+LOG_LEVEL_ROWS = {
+    active: [
+        InlineKeyboardButton(
+            f"{'✅' if active == log_level else ''} {log_level}",
+            callback_data=f"admin_logs_{log_level}_1"
+        )
+        for log_level in LOG_LEVELS
+    ]
+    for active in LOG_LEVELS
+}
 
 async def handle_settings_action(client: Client, callback_query: CallbackQuery):
     """Handle settings menu actions"""
     try:
-        action = callback_query.data.split('_')[2] if len(callback_query.data.split('_')) > 2 else "view"
+        parts = callback_query.data.split('_', 3)
+        action = parts[2] if len(parts) > 2 else "view"
         
         if action == "view":
-            settings_text = (
-                "⚙️ **Bot Settings**\n\n"
-                f"**General Settings:**\n"
-                f"• Workers: {Config.WORKERS}\n"
-                f"• Max Concurrent: {Config.MAX_CONCURRENT_TRANSMISSIONS}\n\n"
-                f"**Search Settings:**\n"
-                f"• Min Search Length: {Config.MIN_SEARCH_LENGTH}\n"
-                f"• Max Results: {Config.MAX_RESULTS}\n\n"
-                f"**File Settings:**\n"
-                f"• Delete Timeout: {Config.DELETE_TIMEOUT}s\n"
-                f"• Cache Cleanup: {Config.CACHE_CLEANUP_DAYS} days\n\n"
-                f"**Channel Settings:**\n"
-                f"• Force Sub: {'✅' if Config.FORCE_SUB_CHANNEL else '❌'}\n"
-                f"• Log Channel: {'✅' if Config.LOG_CHANNEL else '❌'}"
-            )
-            
-            buttons = [
-                [
-                    InlineKeyboardButton("🔄 Update Settings", callback_data="admin_settings_edit"),
-                    InlineKeyboardButton("📝 Edit Config", callback_data="admin_settings_config")
-                ],
-                [InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")]
-            ]
-            
             await callback_query.edit_message_text(
-                settings_text,
-                reply_markup=InlineKeyboardMarkup(buttons)
+                settings_overview_text(),
+                reply_markup=SETTINGS_VIEW_KB
             )
             
         elif action == "edit":
             # Show editable settings
-            buttons = [
-                [
-                    InlineKeyboardButton("⚙️ General", callback_data="admin_settings_section_general"),
-                    InlineKeyboardButton("🔍 Search", callback_data="admin_settings_section_search")
-                ],
-                [
-                    InlineKeyboardButton("📁 Files", callback_data="admin_settings_section_files"),
-                    InlineKeyboardButton("📢 Channels", callback_data="admin_settings_section_channels")
-                ],
-                [InlineKeyboardButton("« Back to Settings", callback_data="admin_settings_view")]
-            ]
-            
             await callback_query.edit_message_text(
                 "⚙️ **Edit Settings**\n\nSelect a category to modify settings:",
-                reply_markup=InlineKeyboardMarkup(buttons)
+                reply_markup=SETTINGS_EDIT_KB
             )
             
     except Exception as e:
@@ -74,85 +151,84 @@ async def handle_settings_action(client: Client, callback_query: CallbackQuery):
         await callback_query.answer(f"Error: {str(e)}", show_alert=True)
 
 # Broadcast Implementation
+BROADCAST_WORKERS = 25
+BROADCAST_RATE = 25  # messages per second across all workers
+BROADCAST_QUEUE_SIZE = 200
+BROADCAST_CURSOR_BATCH = 500
+BROADCAST_STATUS_INTERVAL = 3  # seconds between progress edits
+
 async def handle_broadcast_message(client: Client, message: Message, filter_query: dict = None):
     """Process broadcast message"""
-    status_msg = await message.reply_text("📢 Starting broadcast...")
-    
-    success = 0
-    failed = 0
+    status_msg = await message.reply_text(Messages.BROADCAST_START)
     
-    async for user in client.db.users.find(filter_query or {}):
-        try:
-            await message.copy(user['user_id'])
-            success += 1
-            
-            # Update status every 20 users
-            if success % 20 == 0:
-                await status_msg.edit_text(
-                    f"🔄 Broadcasting...\n"
-                    f"✅ Success: {success}\n"
-                    f"❌ Failed: {failed}"
-                )
-                
-            await asyncio.sleep(0.1)  # Prevent flooding
-            
-        except Exception as e:
-            logger.error(f"Broadcast failed for user {user['user_id']}: {e}")
-            failed += 1
-            
-    await status_msg.edit_text(
-        f"📢 **Broadcast Completed**\n\n"
-        f"✅ Success: {success}\n"
-        f"❌ Failed: {failed}\n"
-        f"💠 Total: {success + failed}"
-    )
+    bucket = TokenBucket(rate=BROADCAST_RATE, capacity=BROADCAST_RATE)
+    queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_SIZE)
+    counts = {'success': 0, 'failed': 0}
 
-async def handle_broadcast_setup(client: Client, callback_query: CallbackQuery):
-    """Setup broadcast message"""
+    async def produce():
+        cursor = client.db.users.find(
+            filter_query or {}, projection={'user_id': 1, '_id': 0}
+        ).batch_size(BROADCAST_CURSOR_BATCH)
+        async for user_ids in batched_user_ids(cursor, BROADCAST_CURSOR_BATCH):
+            for user_id in user_ids:
+                await queue.put(user_id)
+
+    async def work():
+        while True:
+            user_id = await queue.get()
+            try:
+                while True:
+                    await bucket.acquire()
+                    try:
+                        await message.copy(user_id)
+                        break
+                    except errors.FloodWait as e:
+                        # Stall every worker, then retry this user
+                        bucket.pause(e.value)
+                counts['success'] += 1
+            except Exception as e:
+                logger.error(f"Broadcast failed for user {user_id}: {e}")
+                counts['failed'] += 1
+            finally:
+                queue.task_done()
+
+    async def report():
+        reported = (0, 0)
+        while True:
+            await asyncio.sleep(BROADCAST_STATUS_INTERVAL)
+            current = (counts['success'], counts['failed'])
+            # Nothing moved (e.g. paused on FloodWait): don't spend an edit
+            if current == reported:
+                continue
+            reported = current
+            try:
+                await status_msg.edit_text(Messages.BROADCAST_PROGRESS.format(*current))
+            except errors.MessageNotModified:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not update broadcast status: {e}")
+
+    workers = [asyncio.create_task(work()) for _ in range(BROADCAST_WORKERS)]
+    reporter = asyncio.create_task(report())
     try:
-        broadcast_type = callback_query.data.split('_')[2]
-        message_type = callback_query.data.split('_')[3] if len(callback_query.data.split('_')) > 3 else "text"
-        
-        if broadcast_type == "all":
-            filter_query = {}
-            target = "all users"
-        elif broadcast_type == "active":
-            filter_query = {
-                'last_used': {'$gte': datetime.now() - timedelta(days=7)}
-            }
-            target = "active users"
-        else:
-            await callback_query.answer("Invalid broadcast type!")
-            return
-            
-        total_users = await client.db.users.count_documents(filter_query)
-        
-        buttons = [[InlineKeyboardButton("« Cancel", callback_data="admin_broadcast")]]
-        
-        await callback_query.edit_message_text(
-            f"📢 **Broadcast Setup**\n\n"
-            f"Target: {target}\n"
-            f"Estimated recipients: {total_users}\n\n"
-            f"{'Send me the text message' if message_type == 'text' else 'Send me the media with caption'} "
-            f"to broadcast. Use /cancel to cancel.",
-            reply_markup=InlineKeyboardMarkup(buttons)
-        )
-        
-        # Set user state
-        client.broadcast_states[callback_query.from_user.id] = {
-            'state': 'awaiting_broadcast',
-            'filter': filter_query,
-            'type': message_type
-        }
-        
+        await produce()
+        await queue.join()
     except Exception as e:
-        logger.error(f"Error in broadcast setup: {e}")
-        await callback_query.answer(
-            "Error setting up broadcast. Please try again.",
-            show_alert=True
-        )
+        logger.error(f"Broadcast aborted: {e}")
+    finally:
+        for task in workers + [reporter]:
+            task.cancel()
+        await asyncio.gather(*workers, reporter, return_exceptions=True)
+
+    success, failed = counts['success'], counts['failed']
+    await status_msg.edit_text(
+        Messages.BROADCAST_COMPLETE.format(success, failed, success + failed)
+    )
 
 # Updated Logs Implementation
+LOG_FILE = "logs/shadowfinder.log"
+_log_index = LogIndex(LOG_FILE)
+
 async def admin_logs_callback(client: Client, callback_query: CallbackQuery):
     """Handle the Logs button in admin panel"""
     try:
@@ -162,101 +238,66 @@ async def admin_logs_callback(client: Client, callback_query: CallbackQuery):
         page = int(parts[3]) if len(parts) > 3 else 1
         
         try:
-            with open("logs/shadowfinder.log", "r", encoding='utf-8') as file:
-                # Read all lines and reverse them
-                all_logs = file.readlines()
-                all_logs.reverse()
-                
-                # Filter logs by level if specified
-                if level != "ALL":
-                    filtered_logs = [line for line in all_logs if f"| {level}    |" in line]
-                else:
-                    filtered_logs = all_logs
-                
-                # Paginate logs - 10 logs per page
-                start_idx = (page - 1) * 10
-                end_idx = start_idx + 10
-                current_logs = filtered_logs[start_idx:end_idx]
-                total_pages = (len(filtered_logs) + 9) // 10
-                
-                # Format logs for display
-                logs_text = "📝 **Bot Logs**\n\n"
-                
-                if not current_logs:
-                    logs_text += "No logs found for the selected criteria."
-                else:
-                    for log in current_logs:
-                        # Parse and format log entry
-                        try:
-                            parts = log.split("|")
-                            timestamp = parts[0].strip()
-                            log_level = parts[1].strip()
-                            message = parts[-1].strip()
-                            
-                            if "ERROR" in log_level:
-                                logs_text += f"❌ `{timestamp}`\n{message}\n\n"
-                            elif "WARNING" in log_level:
-                                logs_text += f"⚠️ `{timestamp}`\n{message}\n\n"
-                            else:
-                                logs_text += f"ℹ️ `{timestamp}`\n{message}\n\n"
-                        except:
-                            logs_text += f"{log}\n\n"
-                
-                logs_text += f"\nPage {page}/{total_pages}"
-                
-                buttons = []
-                
-                # Level filter buttons
-                level_buttons = []
-                for log_level in ["ALL", "INFO", "WARNING", "ERROR"]:
-                    level_buttons.append(
-                        InlineKeyboardButton(
-                            f"{'✅' if level == log_level else ''} {log_level}", 
-                            callback_data=f"admin_logs_{log_level}_1"
-                        )
-                    )
-                buttons.append(level_buttons)
-                
-                # Navigation buttons
-                nav_buttons = []
-                if page > 1:
-                    nav_buttons.append(
-                        InlineKeyboardButton(
-                            "« Previous", 
-                            callback_data=f"admin_logs_{level}_{page-1}"
-                        )
+            # Seek straight to this page's lines via the offset index
+            current_logs, total = await asyncio.to_thread(_log_index.read_page, level, page)
+            total_pages = (total + 9) // 10
+
+            # Format logs for display
+            text_parts = ["📝 **Bot Logs**\n\n"]
+            
+            if not current_logs:
+                text_parts.append("No logs found for the selected criteria.")
+            else:
+                for log in current_logs:
+                    # Parse and format log entry
+                    match = LOG_LINE_RE.match(log)
+                    if match:
+                        timestamp, log_level, message = match.groups()
+                        emoji = LEVEL_EMOJI.get(log_level, "ℹ️")
+                        text_parts.append(f"{emoji} `{timestamp.rstrip()}`\n{message.rstrip()}\n\n")
+                    else:
+                        text_parts.append(f"{log}\n\n")
+            
+            text_parts.append(f"\nPage {page}/{total_pages}")
+            logs_text = "".join(text_parts)
+            
+            # Level filter buttons
+            buttons = [LOG_LEVEL_ROWS.get(level, LOG_LEVEL_ROWS["ALL"])]
+            
+            # Navigation buttons
+            nav_buttons = []
+            if page > 1:
+                nav_buttons.append(
+                    InlineKeyboardButton(
+                        "« Previous", 
+                        callback_data=f"admin_logs_{level}_{page-1}"
                     )
-                if page < total_pages:
-                    nav_buttons.append(
-                        InlineKeyboardButton(
-                            "Next »", 
-                            callback_data=f"admin_logs_{level}_{page+1}"
-                        )
+                )
+            if page < total_pages:
+                nav_buttons.append(
+                    InlineKeyboardButton(
+                        "Next »", 
+                        callback_data=f"admin_logs_{level}_{page+1}"
                     )
-                if nav_buttons:
-                    buttons.append(nav_buttons)
-                
-                # Action buttons
-                buttons.append([
-                    InlineKeyboardButton("🔄 Refresh", callback_data=f"admin_logs_{level}_{page}"),
-                    InlineKeyboardButton("📥 Download", callback_data="admin_logs_download")
-                ])
-                
-                buttons.append([
-                    InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")
-                ])
-                
-                await callback_query.edit_message_text(
-                    logs_text,
-                    reply_markup=InlineKeyboardMarkup(buttons)
                 )
-                
+            if nav_buttons:
+                buttons.append(nav_buttons)
+            
+            # Action buttons
+            buttons.append([
+                InlineKeyboardButton("🔄 Refresh", callback_data=f"admin_logs_{level}_{page}"),
+                InlineKeyboardButton("📥 Download", callback_data="admin_logs_download")
+            ])
+            
+            buttons.append([BACK_TO_ADMIN_BUTTON])
+            
+            if not await edit_if_changed(callback_query, logs_text, InlineKeyboardMarkup(buttons)):
+                await callback_query.answer("Logs are up to date")
+            
         except FileNotFoundError:
             await callback_query.edit_message_text(
                 "📝 **Bot Logs**\n\n❌ Log file not found!",
-                reply_markup=InlineKeyboardMarkup([[
-                    InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")
-                ]])
+                reply_markup=BACK_TO_ADMIN
             )
             
     except Exception as e:
@@ -266,16 +307,60 @@ async def admin_logs_callback(client: Client, callback_query: CallbackQuery):
             show_alert=True
         )
 
+# The log grows with every line, so an uploaded archive is reused until the log
+# rotates, grows by LOG_UPLOAD_MIN_GROWTH bytes or the upload is LOG_UPLOAD_MAX_AGE old
+LOG_UPLOAD_MAX_AGE = 300  # seconds
+LOG_UPLOAD_MIN_GROWTH = 256 * 1024  # bytes
+# Last uploaded archive: inode, size and time at upload, and its Telegram file_id
+_log_upload = {}
+
+def _gzip_file(src: str, dst: str) -> None:
+    with open(src, 'rb') as f_in, gzip.open(dst, 'wb', compresslevel=6) as f_out:
+        shutil.copyfileobj(f_in, f_out, 64 * 1024)
+
+async def ensure_gzipped(src: str) -> str:
+    """Return a gzip copy of src, recompressing only when src has changed"""
+    dst = f"{src}.gz"
+    try:
+        stale = os.path.getmtime(src) > os.path.getmtime(dst)
+    except FileNotFoundError:
+        if not os.path.exists(src):
+            raise
+        stale = True
+    if stale:
+        await asyncio.to_thread(_gzip_file, src, dst)
+    return dst
+
 async def handle_logs_download(client: Client, callback_query: CallbackQuery):
     """Handle log file download request"""
     try:
-        # Send the log file
-        await client.send_document(
+        stat = os.stat(LOG_FILE)
+        file_id = None
+        if (
+            _log_upload.get('inode') == stat.st_ino
+            and stat.st_size - _log_upload['size'] < LOG_UPLOAD_MIN_GROWTH
+            and time.monotonic() - _log_upload['at'] < LOG_UPLOAD_MAX_AGE
+        ):
+            file_id = _log_upload['file_id']
+
+        if file_id is None:
+            document = await ensure_gzipped(LOG_FILE)
+        else:
+            document = file_id
+
+        sent = await client.send_document(
             callback_query.from_user.id,
-            "logs/shadowfinder.log",
+            document,
             caption="📝 Bot Logs File",
-            file_name="bot_logs.txt"
+            file_name="bot_logs.txt.gz"
         )
+        if file_id is None and sent.document:
+            _log_upload.update(
+                inode=stat.st_ino,
+                size=stat.st_size,
+                at=time.monotonic(),
+                file_id=sent.document.file_id
+            )
         await callback_query.answer("Log file sent to your PM!")
     except FileNotFoundError:
         await callback_query.answer("Log file not found!", show_alert=True)
@@ -291,24 +376,6 @@ async def admin_panel_callback(client: Client, callback_query: CallbackQuery):
     try:
         stats = await get_bot_stats(client.db)
         
-        buttons = [
-            [
-                InlineKeyboardButton("👥 Users", callback_data="admin_users"),
-                InlineKeyboardButton("🚫 Banned", callback_data="admin_banned")
-            ],
-            [
-                InlineKeyboardButton("📊 Statistics", callback_data="admin_stats"),
-                InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
-            ],
-            [
-                InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
-                InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings")
-            ],
-            [
-                InlineKeyboardButton("🔄 Refresh Channels", callback_data="refresh_channels")
-            ]
-        ]
-        
         panel_text = (
             "⚔️ **Shadow Monarch's Admin Panel** ⚔️\n\n"
             f"👥 Total Users: {stats['total_users']}\n"
@@ -317,12 +384,7 @@ async def admin_panel_callback(client: Client, callback_query: CallbackQuery):
             f"📥 Total Downloads: {stats['total_downloads']}\n"
         )
         
-        try:
-            await callback_query.edit_message_text(
-                panel_text,
-                reply_markup=InlineKeyboardMarkup(buttons)
-            )
-        except errors.MessageNotModified:
+        if not await edit_if_changed(callback_query, panel_text, ADMIN_PANEL_KB):
             await callback_query.answer("Panel is already up to date")
             
     except Exception as e:
@@ -332,43 +394,68 @@ async def admin_panel_callback(client: Client, callback_query: CallbackQuery):
             show_alert=True
         )
 
+USERS_PER_PAGE = 10
 
-def is_admin_or_owner(user_id: int) -> bool:
-    """Check if user is admin or owner"""
-    return user_id == Config.OWNER_ID or user_id in Config.ADMIN_IDS
+def format_user_label(user_info) -> str:
+    """'First Last | @username' for a resolved Telegram user"""
+    name = " ".join(filter(None, (user_info.first_name, user_info.last_name))) or "Deleted Account"
+    username = f"@{user_info.username}" if user_info.username else "No username"
+    return f"{name} | {username}"
+
+USER_LIST_PROJECTION = {'user_id': 1, 'banned': 1, 'username': 1, '_id': 0}
 
 async def handle_user_page(client: Client, callback_query: CallbackQuery):
     """Handle user list pagination with improved error handling"""
     try:
-        page = int(callback_query.data.split('_')[-1])
-        skip = (page - 1) * 10
-        
-        # Get total count first
-        total_users = await client.db.users.count_documents({})
-        
-        # Get paginated users
-        users = await client.db.users.find().skip(skip).limit(10).to_list(length=10)
+        # Keyset pagination: admin_users_after_<id> / admin_users_before_<id>.
+        # admin_users_page_<n> comes from buttons sent before keyset paging
+        _, _, direction, anchor = callback_query.data.split('_')
+        anchor = int(anchor)
+
+        if direction == "page":
+            page = max(anchor, 1)
+            users = await client.db.users.find(
+                {}, projection=USER_LIST_PROJECTION
+            ).sort('user_id', 1).skip((page - 1) * USERS_PER_PAGE).limit(
+                USERS_PER_PAGE + 1
+            ).to_list(length=USERS_PER_PAGE + 1)
+            has_next = len(users) > USERS_PER_PAGE
+            users = users[:USERS_PER_PAGE]
+            has_prev = page > 1
+        elif direction == "before":
+            users = await client.db.users.find(
+                {'user_id': {'$lt': anchor}}, projection=USER_LIST_PROJECTION
+            ).sort('user_id', -1).limit(USERS_PER_PAGE + 1).to_list(length=USERS_PER_PAGE + 1)
+            has_prev = len(users) > USERS_PER_PAGE
+            users = users[:USERS_PER_PAGE]
+            users.reverse()
+            has_next = True
+        else:
+            users = await client.db.users.find(
+                {'user_id': {'$gt': anchor}}, projection=USER_LIST_PROJECTION
+            ).sort('user_id', 1).limit(USERS_PER_PAGE + 1).to_list(length=USERS_PER_PAGE + 1)
+            has_next = len(users) > USERS_PER_PAGE
+            users = users[:USERS_PER_PAGE]
+            has_prev = True
+
+        stats = await get_bot_stats(client.db)
         
         user_buttons = []
-        user_text = f"👥 **User List** (Page {page})\n\n"
-        user_text += f"Total Users: {total_users}\n\n"
+        text_parts = ["👥 **User List**\n\n", f"Total Users: {stats['total_users']}\n\n"]
+        
+        # Resolve the whole page in one get_users call
+        user_infos = await get_users_cached(client, [user['user_id'] for user in users])
         
         for user in users:
-            try:
-                # Get user details from Telegram
-                user_info = await client.get_users(user['user_id'])
-                name = user_info.first_name
-                if user_info.last_name:
-                    name += f" {user_info.last_name}"
-                username = f"@{user_info.username}" if user_info.username else "No username"
-                
-                status = "🚫" if user.get('banned', False) else "✅"
-                user_entry = f"{status} {name} | {username}"
-            except Exception as e:
-                logger.warning(f"Could not get user info for {user['user_id']}: {e}")
+            user_info = user_infos.get(user['user_id'])
+            if user_info is None:
+                logger.warning(f"Could not get user info for {user['user_id']}")
                 user_entry = f"User {user['user_id']}"
+            else:
+                status = "🚫" if user.get('banned', False) else "✅"
+                user_entry = f"{status} {format_user_label(user_info)}"
             
-            user_text += f"• {user_entry}\n"
+            text_parts.append(f"• {user_entry}\n")
             user_buttons.append([
                 InlineKeyboardButton(
                     user_entry[:64],  # Telegram button text limit
@@ -376,27 +463,24 @@ async def handle_user_page(client: Client, callback_query: CallbackQuery):
                 )
             ])
         
-        # Add navigation buttons
+        # Add navigation buttons, anchored on the first/last user shown
         nav_buttons = []
-        if page > 1:
+        if users and has_prev:
             nav_buttons.append(
-                InlineKeyboardButton("« Previous", callback_data=f"admin_users_page_{page-1}")
+                InlineKeyboardButton("« Previous", callback_data=f"admin_users_before_{users[0]['user_id']}")
             )
-        if (page * 10) < total_users:
+        if users and has_next:
             nav_buttons.append(
-                InlineKeyboardButton("Next »", callback_data=f"admin_users_page_{page+1}")
+                InlineKeyboardButton("Next »", callback_data=f"admin_users_after_{users[-1]['user_id']}")
             )
         
         user_buttons.append(nav_buttons)
-        user_buttons.append([InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")])
+        user_buttons.append([BACK_TO_ADMIN_BUTTON])
+        user_text = "".join(text_parts)
         
         try:
-            await callback_query.edit_message_text(
-                user_text,
-                reply_markup=InlineKeyboardMarkup(user_buttons)
-            )
-        except errors.MessageNotModified:
-            await callback_query.answer("Page is already displayed")
+            if not await edit_if_changed(callback_query, user_text, InlineKeyboardMarkup(user_buttons)):
+                await callback_query.answer("Page is already displayed")
         except errors.MessageIdInvalid:
             await callback_query.message.reply_text(
                 user_text,
@@ -419,7 +503,7 @@ async def handle_user_page(client: Client, callback_query: CallbackQuery):
 async def handle_user_details(client: Client, callback_query: CallbackQuery):
     """Handle user details display"""
     try:
-        user_id = int(callback_query.data.split('_')[-1])
+        user_id = int(callback_query.data.rsplit('_', 1)[-1])
         user_data = await client.db.users.find_one({'user_id': user_id})
         
         if not user_data:
@@ -427,7 +511,7 @@ async def handle_user_details(client: Client, callback_query: CallbackQuery):
             return
             
         try:
-            user_info = await client.get_users(user_id)
+            user_info = await get_user_cached(client, user_id)
             name = user_info.first_name
             if user_info.last_name:
                 name += f" {user_info.last_name}"
@@ -454,7 +538,7 @@ async def handle_user_details(client: Client, callback_query: CallbackQuery):
             
         buttons.extend([
             [InlineKeyboardButton("📊 User Stats", callback_data=f"user_stats_{user_id}")],
-            [InlineKeyboardButton("« Back to Users", callback_data="admin_users")]
+            [BACK_TO_USERS_BUTTON]
         ])
         
         await callback_query.edit_message_text(
@@ -468,7 +552,7 @@ async def handle_user_details(client: Client, callback_query: CallbackQuery):
 async def handle_user_stats(client: Client, callback_query: CallbackQuery):
     """Handle detailed user statistics"""
     try:
-        user_id = int(callback_query.data.split('_')[-1])
+        user_id = int(callback_query.data.rsplit('_', 1)[-1])
         user_data = await client.db.users.find_one({'user_id': user_id})
         
         if not user_data:
@@ -477,28 +561,31 @@ async def handle_user_stats(client: Client, callback_query: CallbackQuery):
             
         # Get user's recent activities
         recent_downloads = await client.db.downloads.find(
-            {'user_id': user_id}
+            {'user_id': user_id},
+            projection={'file_name': 1, 'timestamp': 1, '_id': 0}
         ).sort('timestamp', -1).limit(5).to_list(length=5)
         
         recent_searches = await client.db.searches.find(
-            {'user_id': user_id}
+            {'user_id': user_id},
+            projection={'query': 1, 'timestamp': 1, '_id': 0}
         ).sort('timestamp', -1).limit(5).to_list(length=5)
         
-        stats_text = (
+        text_parts = [
             f"📊 **Detailed Stats for User {user_id}**\n\n"
             f"**Activity Summary:**\n"
             f"• Total Downloads: {user_data.get('downloads', 0)}\n"
             f"• Total Searches: {user_data.get('searches', 0)}\n"
-            f"• Active Days: {(datetime.now() - user_data['joined_date']).days}\n\n"
+            f"• Active Days: {(datetime.now(timezone.utc) - user_data['joined_date']).days}\n\n"
             f"**Recent Downloads:**\n"
-        )
+        ]
         
         for dl in recent_downloads:
-            stats_text += f"• {dl.get('file_name', 'Unknown')} ({dl['timestamp'].strftime('%Y-%m-%d')})\n"
+            text_parts.append(f"• {dl.get('file_name', 'Unknown')} ({dl['timestamp'].strftime('%Y-%m-%d')})\n")
             
-        stats_text += "\n**Recent Searches:**\n"
+        text_parts.append("\n**Recent Searches:**\n")
         for search in recent_searches:
-            stats_text += f"• {search.get('query', 'Unknown')} ({search['timestamp'].strftime('%Y-%m-%d')})\n"
+            text_parts.append(f"• {search.get('query', 'Unknown')} ({search['timestamp'].strftime('%Y-%m-%d')})\n")
+        stats_text = "".join(text_parts)
         
         buttons = [
             [InlineKeyboardButton("« Back to User Details", callback_data=f"user_details_{user_id}")]
@@ -515,7 +602,7 @@ async def handle_user_stats(client: Client, callback_query: CallbackQuery):
 async def handle_banned_user_details(client: Client, callback_query: CallbackQuery):
     """Handle banned user details display"""
     try:
-        user_id = int(callback_query.data.split('_')[-1])
+        user_id = int(callback_query.data.rsplit('_', 1)[-1])
         user_data = await client.db.users.find_one({'user_id': user_id, 'banned': True})
         
         if not user_data:
@@ -537,7 +624,7 @@ async def handle_banned_user_details(client: Client, callback_query: CallbackQue
         
         buttons = [
             [InlineKeyboardButton("✅ Unban User", callback_data=f"unban_user_{user_id}")],
-            [InlineKeyboardButton("« Back to Banned Users", callback_data="admin_banned")]
+            [BACK_TO_BANNED_BUTTON]
         ]
         
         await callback_query.edit_message_text(
@@ -548,30 +635,33 @@ async def handle_banned_user_details(client: Client, callback_query: CallbackQue
         logger.error(f"Error in banned user details handler: {e}")
         await callback_query.answer(f"Error: {str(e)}", show_alert=True)
 
+@async_ttl_cache(30, key=lambda db: "most_active_users")
+async def _most_active_users(db):
+    """Top five users by downloads, cached briefly for repeated stats views"""
+    return await db.users.find(
+        {}, {'user_id': 1, 'downloads': 1, '_id': 0}
+    ).sort('downloads', -1).limit(5).to_list(length=5)
+
+@async_ttl_cache(30, key=lambda db, limit: limit)
+async def _popular_files(db, limit: int):
+    """Most accessed cached files, cached briefly for repeated stats views"""
+    return await FileCache(db).get_popular_files(limit)
+
 async def handle_detailed_stats(client: Client, callback_query: CallbackQuery):
     """Handle detailed statistics display"""
     try:
-        stats = await get_bot_stats()
-        file_cache = FileCache(client.db)
-        
-        # Get today's stats
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_downloads = await client.db.downloads.count_documents({
-            'timestamp': {'$gte': today}
-        })
-        today_searches = await client.db.searches.count_documents({
-            'timestamp': {'$gte': today}
-        })
-        
-        # Get most active users
-        active_users = await client.db.users.find().sort(
-            'downloads', -1
-        ).limit(5).to_list(length=5)
-        
-        # Get popular files
-        popular_files = await file_cache.get_popular_files(5)
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # The queries are independent, so run them concurrently
+        stats, today_downloads, today_searches, active_users, popular_files = await asyncio.gather(
+            get_bot_stats(client.db),
+            client.db.downloads.count_documents({'timestamp': {'$gte': today}}),
+            client.db.searches.count_documents({'timestamp': {'$gte': today}}),
+            _most_active_users(client.db),
+            _popular_files(client.db, 5)
+        )
         
-        stats_text = (
+        text_parts = [
             "📊 **Detailed Bot Statistics**\n\n"
             f"**Today's Activity:**\n"
             f"• Downloads: {today_downloads}\n"
@@ -583,26 +673,19 @@ async def handle_detailed_stats(client: Client, callback_query: CallbackQuery):
             f"• Total Files: {stats['total_files']}\n"
             f"• Total Downloads: {stats['total_downloads']}\n\n"
             f"**Most Active Users:**\n"
-        )
+        ]
         
         for user in active_users:
-            stats_text += f"• ID: {user['user_id']} - {user.get('downloads', 0)} downloads\n"
+            text_parts.append(f"• ID: {user['user_id']} - {user.get('downloads', 0)} downloads\n")
             
-        stats_text += "\n**Most Popular Files:**\n"
+        text_parts.append("\n**Most Popular Files:**\n")
         for file in popular_files:
-            stats_text += f"• {file['file_name']} ({file['access_count']} downloads)\n"
-        
-        buttons = [
-            [
-                InlineKeyboardButton("📈 Usage Trends", callback_data="stats_trends"),
-                InlineKeyboardButton("📊 Daily Stats", callback_data="stats_daily")
-            ],
-            [InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")]
-        ]
+            text_parts.append(f"• {file['file_name']} ({file['access_count']} downloads)\n")
+        stats_text = "".join(text_parts)
         
         await callback_query.edit_message_text(
             stats_text,
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=DETAILED_STATS_KB
         )
     except Exception as e:
         logger.error(f"Error in detailed stats handler: {e}")
@@ -612,28 +695,17 @@ async def handle_user_unban(client: Client, callback_query: CallbackQuery):
     """Handle user unban callback"""
     try:
         # Get user ID from callback data
-        user_id = int(callback_query.data.split('_')[-1])
+        user_id = int(callback_query.data.rsplit('_', 1)[-1])
         
-        # Get user data
-        user_data = await client.db.users.find_one({'user_id': user_id})
-        
-        if not user_data:
-            await callback_query.answer("User not found!", show_alert=True)
-            return
-            
-        if not user_data.get('banned', False):
-            await callback_query.answer("User is not banned!", show_alert=True)
-            return
-            
         try:
-            # Update user data
-            await client.db.users.update_one(
-                {'user_id': user_id},
+            # Unban in one conditional write; only a miss needs a follow-up read
+            result = await client.db.users.update_one(
+                {'user_id': user_id, 'banned': True},
                 {
                     '$set': {
                         'banned': False,
                         'unbanned_by': callback_query.from_user.id,
-                        'unban_date': datetime.now(),
+                        'unban_date': datetime.now(timezone.utc),
                     },
                     '$unset': {
                         'ban_reason': "",
@@ -642,15 +714,37 @@ async def handle_user_unban(client: Client, callback_query: CallbackQuery):
                     }
                 }
             )
+            if not result.matched_count:
+                if await client.db.users.count_documents({'user_id': user_id}, limit=1):
+                    await callback_query.answer("User is not banned!", show_alert=True)
+                else:
+                    await callback_query.answer("User not found!", show_alert=True)
+                return
+            get_bot_stats.cache_clear()
             
-            # Try to get user info
-            try:
-                user_info = await client.get_users(user_id)
-                user_mention = user_info.mention
-                username = f"@{user_info.username}" if user_info.username else "No username"
-            except:
+            async def notify_user():
+                unban_message = (
+                    "✅ **You have been unbanned!**\n\n"
+                    f"You can now use the bot again.\n"
+                    f"Unbanned by: {callback_query.from_user.mention}"
+                )
+                await client.send_message(user_id, unban_message)
+
+            # The user lookup and the user's notification are independent
+            user_info, notified = await asyncio.gather(
+                get_user_cached(client, user_id),
+                notify_user(),
+                return_exceptions=True
+            )
+            if isinstance(notified, Exception):
+                logger.warning(f"Failed to notify user about unban: {notified}")
+
+            if isinstance(user_info, Exception):
                 user_mention = f"User {user_id}"
                 username = "Unknown"
+            else:
+                user_mention = user_info.mention
+                username = f"@{user_info.username}" if user_info.username else "No username"
             
             # Send unban notification to log channel
             if Config.LOG_CHANNEL:
@@ -659,44 +753,25 @@ async def handle_user_unban(client: Client, callback_query: CallbackQuery):
                     f"**User:** {user_mention} [`{user_id}`]\n"
                     f"**Username:** {username}\n"
                     f"**Unbanned By:** {callback_query.from_user.mention}\n"
-                    f"**Date:** `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+                    f"**Date:** `{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}`"
                 )
-                try:
-                    await client.send_message(Config.LOG_CHANNEL, log_text)
-                except Exception as e:
-                    logger.error(f"Failed to send unban log: {e}")
-            
-            # Notify user about unban
-            try:
-                unban_message = (
-                    "✅ **You have been unbanned!**\n\n"
-                    f"You can now use the bot again.\n"
-                    f"Unbanned by: {callback_query.from_user.mention}"
-                )
-                await client.send_message(user_id, unban_message)
-            except Exception as e:
-                logger.warning(f"Failed to notify user about unban: {e}")
+                send_log(client, log_text)
             
             # Show success message
             await callback_query.answer("User unbanned successfully!", show_alert=True)
             
-            # Update the message to show updated user status
-            buttons = [[
-                InlineKeyboardButton("🔙 Back to Users", callback_data="admin_banned")
-            ]]
-            
             success_text = (
                 f"✅ **User Unbanned Successfully**\n\n"
                 f"**User ID:** `{user_id}`\n"
                 f"**Username:** {username}\n"
                 f"**Unbanned By:** {callback_query.from_user.mention}\n"
-                f"**Date:** `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+                f"**Date:** `{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}`"
             )
             
             try:
                 await callback_query.edit_message_text(
                     success_text,
-                    reply_markup=InlineKeyboardMarkup(buttons)
+                    reply_markup=BACK_TO_BANNED
                 )
             except errors.MessageNotModified:
                 pass
@@ -720,10 +795,17 @@ async def handle_user_unban(client: Client, callback_query: CallbackQuery):
             show_alert=True
         )
 
+@async_ttl_cache(30, key=lambda db: "active_user_count")
+async def _active_user_count(db):
+    """Users seen in the last 7 days, cached briefly for the broadcast estimate"""
+    return await db.users.count_documents({
+        'last_used': {'$gte': datetime.now(timezone.utc) - timedelta(days=7)}
+    })
+
 async def handle_broadcast_setup(client: Client, callback_query: CallbackQuery):
     """Handle broadcast message setup"""
     try:
-        broadcast_type = callback_query.data.split('_')[-1]
+        broadcast_type = callback_query.data.rsplit('_', 1)[-1]
         
         if broadcast_type == "all":
             target_text = "all users"
@@ -732,14 +814,18 @@ async def handle_broadcast_setup(client: Client, callback_query: CallbackQuery):
             target_text = "active users (last 7 days)"
             filter_query = {
                 'last_used': {
-                    '$gte': datetime.now() - timedelta(days=7)
+                    '$gte': datetime.now(timezone.utc) - timedelta(days=7)
                 }
             }
         else:
             await callback_query.answer("Invalid broadcast type!", show_alert=True)
             return
             
-        user_count = await client.db.users.count_documents(filter_query)
+        if filter_query:
+            user_count = await _active_user_count(client.db)
+        else:
+            # Collection metadata only; no scan for the "all" target
+            user_count = await client.db.users.estimated_document_count()
         
         setup_text = (
             "📢 **Broadcast Setup**\n\n"
@@ -769,24 +855,25 @@ async def handle_broadcast_setup(client: Client, callback_query: CallbackQuery):
 async def admin_users_callback(client: Client, callback_query: CallbackQuery):
     """Handle the Users button in admin panel"""
     try:
-        users = await client.db.users.find().to_list(length=10)
+        users = await client.db.users.find(
+            {}, projection=USER_LIST_PROJECTION
+        ).sort('user_id', 1).limit(USERS_PER_PAGE + 1).to_list(length=USERS_PER_PAGE + 1)
+        has_next = len(users) > USERS_PER_PAGE
+        users = users[:USERS_PER_PAGE]
         
         user_buttons = []
-        user_details_text = "👥 **User List**\n\n"
+        text_parts = ["👥 **User List**\n\n"]
+        
+        # Resolve the whole page in one get_users call
+        user_infos = await get_users_cached(client, [user['user_id'] for user in users])
         
         for user in users:
-            try:
-                # Get user details from Telegram
-                user_info = await client.get_users(user['user_id'])
-                name = user_info.first_name
-                if user_info.last_name:
-                    name += f" {user_info.last_name}"
-                username = f"@{user_info.username}" if user_info.username else "No username"
-                
-                user_text = f"{name} | {username}"
-            except Exception as e:
-                logger.warning(f"Could not get user info for {user['user_id']}: {e}")
+            user_info = user_infos.get(user['user_id'])
+            if user_info is None:
+                logger.warning(f"Could not get user info for {user['user_id']}")
                 user_text = f"User {user['user_id']}"
+            else:
+                user_text = format_user_label(user_info)
             
             user_buttons.append([
                 InlineKeyboardButton(
@@ -794,22 +881,20 @@ async def admin_users_callback(client: Client, callback_query: CallbackQuery):
                     callback_data=f"user_details_{user['user_id']}"
                 )
             ])
-            user_details_text += f"• {user_text}\n"
+            text_parts.append(f"• {user_text}\n")
         
-        user_buttons.append([
-            InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel"),
-            InlineKeyboardButton("Next Page »", callback_data="admin_users_page_2")
-        ])
+        nav_row = [BACK_TO_ADMIN_BUTTON]
+        if has_next:
+            nav_row.append(
+                InlineKeyboardButton("Next Page »", callback_data=f"admin_users_after_{users[-1]['user_id']}")
+            )
+        user_buttons.append(nav_row)
+        user_details_text = "".join(text_parts)
         
-        # Try to edit the message, handle MESSAGE_NOT_MODIFIED error
+        # Skip the edit when the message already shows this page
         try:
-            await callback_query.edit_message_text(
-                user_details_text,
-                reply_markup=InlineKeyboardMarkup(user_buttons)
-            )
-        except errors.MessageNotModified:
-            # Message is already showing the same content, ignore this error
-            await callback_query.answer("User list is already up to date")
+            if not await edit_if_changed(callback_query, user_details_text, InlineKeyboardMarkup(user_buttons)):
+                await callback_query.answer("User list is already up to date")
         except errors.MessageIdInvalid:
             # Message might have been deleted, send new message
             await callback_query.message.reply_text(
@@ -849,11 +934,13 @@ async def admin_users_callback(client: Client, callback_query: CallbackQuery):
 async def admin_banned_callback(client: Client, callback_query: CallbackQuery):
     """Handle the Banned Users button in admin panel"""
     try:
-        # Fetch banned users
-        banned_users = await client.db.users.find({'banned': True}).to_list(length=10)
+        # Fetch banned users; one batch, only the fields the buttons use
+        cursor = client.db.users.find(
+            {'banned': True}, projection={'user_id': 1, 'username': 1, '_id': 0}
+        ).limit(USERS_PER_PAGE).batch_size(USERS_PER_PAGE)
         
         banned_buttons = []
-        for user in banned_users:
+        async for user in cursor:
             banned_buttons.append([
                 InlineKeyboardButton(
                     f"{user.get('username', 'Unknown')} (ID: {user['user_id']})", 
@@ -862,7 +949,7 @@ async def admin_banned_callback(client: Client, callback_query: CallbackQuery):
             ])
         
         banned_buttons.append([
-            InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel"),
+            BACK_TO_ADMIN_BUTTON,
             InlineKeyboardButton("Unban Selected", callback_data="admin_unban_users")
         ])
         
@@ -878,15 +965,11 @@ async def admin_banned_callback(client: Client, callback_query: CallbackQuery):
 async def admin_stats_callback(client: Client, callback_query: CallbackQuery):
     """Handle the Statistics button in admin panel"""
     try:
-        # Fetch comprehensive bot statistics
-        stats = await get_bot_stats(client.db)
-        
-        # Fetch some additional stats from the models
-        user_model = User(client.db)
-        file_cache = FileCache(client.db)
-        
-        # Get most popular files
-        popular_files = await file_cache.get_popular_files(5)
+        # Fetch bot statistics and the most popular files together
+        stats, popular_files = await asyncio.gather(
+            get_bot_stats(client.db),
+            _popular_files(client.db, 5)
+        )
         popular_files_text = "\n".join([
             f"{file['file_name']} (Accessed: {file['access_count']} times)" 
             for file in popular_files
@@ -902,12 +985,8 @@ async def admin_stats_callback(client: Client, callback_query: CallbackQuery):
             f"{popular_files_text}"
         )
         
-        await callback_query.edit_message_text(
-            stats_text,
-            reply_markup=InlineKeyboardMarkup([
-                [InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")]
-            ])
-        )
+        if not await edit_if_changed(callback_query, stats_text, BACK_TO_ADMIN):
+            await callback_query.answer("Statistics are up to date")
     except Exception as e:
         logger.error(f"Error in admin stats callback: {e}")
         await callback_query.answer(f"Error fetching statistics: {str(e)}", show_alert=True)
@@ -919,13 +998,7 @@ async def admin_broadcast_callback(client: Client, callback_query: CallbackQuery
         await callback_query.edit_message_text(
             "📢 **Broadcast Message**\n\n"
             "Select broadcast options:",
-            reply_markup=InlineKeyboardMarkup([
-                [
-                    InlineKeyboardButton("All Users", callback_data="broadcast_all_users"),
-                    InlineKeyboardButton("Active Users", callback_data="broadcast_active_users")
-                ],
-                [InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")]
-            ])
+            reply_markup=BROADCAST_MENU_KB
         )
     except Exception as e:
         logger.error(f"Error in admin broadcast callback: {e}")
@@ -934,37 +1007,9 @@ async def admin_broadcast_callback(client: Client, callback_query: CallbackQuery
 async def admin_settings_callback(client: Client, callback_query: CallbackQuery):
     """Handle the Settings button in admin panel"""
     try:
-        settings_text = (
-            "⚙️ **Bot Settings**\n\n"
-            f"**General Settings:**\n"
-            f"• Workers: {Config.WORKERS}\n"
-            f"• Max Concurrent: {Config.MAX_CONCURRENT_TRANSMISSIONS}\n\n"
-            f"**Search Settings:**\n"
-            f"• Min Search Length: {Config.MIN_SEARCH_LENGTH}\n"
-            f"• Max Results: {Config.MAX_RESULTS}\n\n"
-            f"**File Settings:**\n"
-            f"• Delete Timeout: {Config.DELETE_TIMEOUT}s\n"
-            f"• Cache Cleanup: {Config.CACHE_CLEANUP_DAYS} days\n\n"
-            f"**Channel Settings:**\n"
-            f"• Force Sub: {'✅' if Config.FORCE_SUB_CHANNEL else '❌'}\n"
-            f"• Log Channel: {'✅' if Config.LOG_CHANNEL else '❌'}"
-        )
-        
-        buttons = [
-            [
-                InlineKeyboardButton("🛠 General", callback_data="settings_section_general"),
-                InlineKeyboardButton("🔍 Search", callback_data="settings_section_search")
-            ],
-            [
-                InlineKeyboardButton("📁 Files", callback_data="settings_section_files"),
-                InlineKeyboardButton("📢 Channels", callback_data="settings_section_channels")
-            ],
-            [InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_panel")]
-        ]
-        
         await callback_query.edit_message_text(
-            settings_text,
-            reply_markup=InlineKeyboardMarkup(buttons)
+            settings_overview_text(),
+            reply_markup=SETTINGS_MENU_KB
         )
         
     except Exception as e:
@@ -979,37 +1024,12 @@ async def refresh_channels_callback(client: Client, callback_query):
             return
 
         # Get updated channels list
-        channels_text = "📑 **Configured Search Channels:**\n\n"
+        channels_text = await render_channels_text(client)
         
-        for channel_id in Config.SEARCH_CHANNELS:
-            try:
-                chat = await client.get_chat(channel_id)
-                chat_type = "Channel" if chat.type == enums.ChatType.CHANNEL else "Group"
-                member_count = await client.get_chat_members_count(channel_id)
-                channels_text += (
-                    f"• **{chat.title}**\n"
-                    f"  ├ **ID**: `{channel_id}`\n"
-                    f"  ├ **Type**: `{chat_type}`\n"
-                    f"  ├ **Members**: `{member_count}`\n"
-                    f"  └ **Username**: @{chat.username if chat.username else 'Private'}\n\n"
-                )
-            except Exception as e:
-                channels_text += f"• **Channel ID**: `{channel_id}`\n  └ Error: `{str(e)}`\n\n"
-
-        if not Config.SEARCH_CHANNELS:
-            channels_text += "❌ No channels configured for search!"
-
-        channels_text += f"\n**Total Configured Channels**: `{len(Config.SEARCH_CHANNELS)}`"
-        
-        buttons = [[
-            InlineKeyboardButton("🔄 Refresh", callback_data="refresh_channels")
-        ]]
-
-        await callback_query.message.edit_text(
-            channels_text,
-            reply_markup=InlineKeyboardMarkup(buttons)
-        )
-        await callback_query.answer("Channel list refreshed!")
+        if await edit_if_changed(callback_query, channels_text, CHANNELS_REFRESH_KB):
+            await callback_query.answer("Channel list refreshed!")
+        else:
+            await callback_query.answer("Channel list is already up to date")
 
     except Exception as e:
         logger.error(f"Error in refresh channels callback: {e}")
@@ -1019,7 +1039,7 @@ async def handle_settings_section(client: Client, callback_query: CallbackQuery)
     """Handle settings section selection"""
     try:
         # Get section from callback data
-        section = callback_query.data.split('_')[-1]
+        section = callback_query.data.rsplit('_', 1)[-1]
         
         # Define settings data
         settings_data = {
@@ -1042,7 +1062,7 @@ async def handle_settings_section(client: Client, callback_query: CallbackQuery)
                 "title": "File Settings",
                 "settings": {
                     "Cache Cleanup Days": Config.CACHE_CLEANUP_DAYS,
-                    "Max Cache Size": getattr(Config, 'MAX_CACHE_SIZE', 10000)
+                    "Max Cache Size": Config.MAX_CACHE_SIZE
                 }
             },
             "channels": {
@@ -1078,9 +1098,7 @@ async def handle_settings_section(client: Client, callback_query: CallbackQuery)
             ])
         
         # Add navigation button
-        buttons.append([
-            InlineKeyboardButton("« Back to Settings", callback_data="admin_settings")
-        ])
+        buttons.append([BACK_TO_SETTINGS_BUTTON])
         
         await callback_query.edit_message_text(
             settings_text,
@@ -1127,11 +1145,7 @@ async def handle_settings_edit(client: Client, callback_query: CallbackQuery):
             InlineKeyboardButton("« Back", callback_data=f"settings_section_{section}")
         ]]
         
-        # Initialize user_states if not exists
-        if not hasattr(client, 'user_states'):
-            client.user_states = {}
-            
-        # Set user state for setting edit
+        # Set user state (client.user_states is a bounded TTLCache set up by ShadowFinder) for setting edit
         client.user_states[callback_query.from_user.id] = {
             'state': 'awaiting_setting',
             'section': section,
@@ -1152,11 +1166,16 @@ async def handle_settings_edit(client: Client, callback_query: CallbackQuery):
         )
 
 
+ADMIN_CALLBACK_PREFIXES = frozenset({
+    "admin", "user", "banned", "unban", "stats", "broadcast", "settings", "refresh"
+})
+
 @Client.on_callback_query()
 async def handle_callback(client: Client, callback: CallbackQuery):
     """Handle callback queries"""
     try:
-        if callback.data.startswith(("admin_", "user_", "banned_", "stats_", "broadcast_", "settings_", "refresh_")):
+        prefix, _, payload = callback.data.partition("_")
+        if prefix in ADMIN_CALLBACK_PREFIXES:
             if not is_admin_or_owner(callback.from_user.id):
                 await callback.answer("You're not authorized!", show_alert=True)
                 return
@@ -1166,11 +1185,11 @@ async def handle_callback(client: Client, callback: CallbackQuery):
             return
 
         # Handle file download callback (dl_)
-        if not callback.data.startswith("dl_"):
+        if prefix != "dl":
             return
-                
-            
-        short_id = callback.data.split("_")[1]
+
+        # Short IDs are urlsafe base64 and may themselves contain "_"
+        short_id = payload
         status_message = None
         
         try:
@@ -1198,20 +1217,14 @@ async def handle_callback(client: Client, callback: CallbackQuery):
             return
 
         # Get file from cache
-        file_cache = FileCache(client.db)
-        file_id = await file_cache.get_file_id_from_short_id(short_id)
+        file_cache = client.file_cache
+        cached_file = await file_cache.get_cached_file_by_short_id(short_id)
         
-        if not file_id:
+        if not cached_file:
             await status_message.edit_text("❌ File not found!")
             await callback.answer("File not found in cache", show_alert=True)
             return
-            
-        # Get cached file info
-        cached_file = await file_cache.get_cached_file(file_id)
-        if not cached_file:
-            await status_message.edit_text("❌ File information not found!")
-            await callback.answer("File info missing", show_alert=True)
-            return
+        file_id = cached_file['file_id']
 
         success = False
         error_message = None
@@ -1226,9 +1239,9 @@ async def handle_callback(client: Client, callback: CallbackQuery):
                 error_message = "File source information missing"
                 raise ValueError("Missing source information")
 
+            # Status stays at "Processing" until the file is delivered; intermediate
+            # edits would each cost a round trip before the file goes out
             # Step 1: Get original message using userbot
-            await status_message.edit_text("🔄 Retrieving file...")
-            
             logger.debug(f"Attempting to get message from channel: {channel_id}, message: {message_id}")
             try:
                 source_message = await client.user_bot.get_messages(
@@ -1245,8 +1258,6 @@ async def handle_callback(client: Client, callback: CallbackQuery):
                 raise Exception("Source message not found")
 
             # Step 2: Forward to temp channel using userbot
-            await status_message.edit_text("🔄 Processing file...")
-            
             try:
                 # First try copying to temp channel
                 temp_msg = await source_message.copy(
@@ -1264,12 +1275,7 @@ async def handle_callback(client: Client, callback: CallbackQuery):
                 error_message = "Failed to process file"
                 raise Exception("Failed to forward to temp channel")
 
-            # Small delay to ensure message processing
-            await asyncio.sleep(1)
-
             # Step 3: Bot forwards from temp channel to user
-            await status_message.edit_text("🔄 Sending file...")
-            
             sent_msg = await client.copy_message(
                 chat_id=callback.from_user.id,
                 from_chat_id=Config.TEMP_CHANNEL,
@@ -1280,13 +1286,10 @@ async def handle_callback(client: Client, callback: CallbackQuery):
             if sent_msg:
                 success = True
                 # Add deletion task for the sent file message
-                asyncio.create_task(delete_message_later(sent_msg)) 
+                run_in_background(delete_message_later(sent_msg), "schedule file deletion")
                 
                 # Clean up temp message
-                try:
-                    await temp_msg.delete()
-                except Exception as e:
-                    logger.error(f"Failed to delete temp message: {e}")
+                run_in_background(temp_msg.delete(), "delete temp message")
 
         except ValueError as ve:
             error_message = str(ve)
@@ -1296,28 +1299,19 @@ async def handle_callback(client: Client, callback: CallbackQuery):
             logger.error(f"Error in file processing: {e}")
 
         if success:
-            # Update user stats
-            try:
-                user_model = User(client.db)
-                await user_model.update_user_stats(
-                    callback.from_user.id,
-                    download=True
-                )
-                
-                # Update access count
-                downloads = cached_file.get('access_count', 0) + 1
-                await file_cache.increment_access_count(file_id)
-                
-                # Delete status message
-                await status_message.delete()
-                
-                await callback.answer(
-                    f"✅ File sent successfully! ({downloads} downloads)",
-                    show_alert=True
-                )
-            except Exception as e:
-                logger.error(f"Failed to update stats: {e}")
-                await callback.answer("File sent but failed to update stats", show_alert=True)
+            # The user has the file; bookkeeping needn't hold up the answer
+            run_in_background(
+                client.user_db.update_user_stats(callback.from_user.id, download=True),
+                "update user stats"
+            )
+            await file_cache.increment_access_count(file_id)
+            downloads = cached_file.get('access_count', 0) + 1
+            run_in_background(status_message.delete(), "delete status message")
+            
+            await callback.answer(
+                f"✅ File sent successfully! ({downloads} downloads)",
+                show_alert=True
+            )
         else:
             error_text = (
                 "❌ Failed to send file\n\n"
@@ -1342,63 +1336,44 @@ async def handle_callback(client: Client, callback: CallbackQuery):
             show_alert=True
         )
 
+# (prefix, action) of "prefix_action[_tail]" callback data -> handler
+_ADMIN_DISPATCH = {
+    ("admin", "panel"): admin_panel_callback,
+    ("admin", "users"): admin_users_callback,
+    ("admin", "banned"): admin_banned_callback,
+    ("admin", "stats"): admin_stats_callback,
+    ("admin", "logs"): admin_logs_callback,
+    ("admin", "broadcast"): admin_broadcast_callback,
+    ("admin", "settings"): admin_settings_callback,
+    ("settings", "section"): handle_settings_section,
+    ("settings", "edit"): handle_settings_edit,
+    ("user", "details"): handle_user_details,
+    ("user", "stats"): handle_user_stats,
+    ("banned", "user"): handle_banned_user_details,
+    ("unban", "user"): handle_user_unban,
+    ("refresh", "channels"): refresh_channels_callback,
+}
+# Overrides used when the callback data carries a tail after the action
+_ADMIN_TAIL_DISPATCH = {
+    ("admin", "users"): handle_user_page,
+}
+# Overrides matched on the whole callback data
+_ADMIN_EXACT_DISPATCH = {
+    "admin_logs_download": handle_logs_download,
+}
+
 async def handle_admin_callbacks(client: Client, callback: CallbackQuery):
     """Handle all admin-related callbacks"""
     try:
-        parts = callback.data.split('_')
-        main_type = parts[0]
-        
-        # First handle admin panel callback
-        if callback.data == "admin_panel":
-            await admin_panel_callback(client, callback)
-            return
-            
-        # Handle other admin callbacks
-        if main_type == "admin":
-            action = parts[1]
-            if action == "users":
-                await admin_users_callback(client, callback)
-            elif action == "banned":
-                await admin_banned_callback(client, callback)
-            elif action == "stats":
-                await admin_stats_callback(client, callback)
-            elif action == "logs":
-                if len(parts) > 2 and parts[2] == "download":
-                    await handle_logs_download(client, callback)
-                else:
-                    await admin_logs_callback(client, callback)
-            elif action == "broadcast":
-                await admin_broadcast_callback(client, callback)
-            elif action == "settings":
-                await admin_settings_callback(client, callback)
-                
-        # Handle settings callbacks
-        elif main_type == "settings":
-            if parts[1] == "section":
-                await handle_settings_section(client, callback)
-            elif parts[1] == "edit":
-                await handle_settings_edit(client, callback)
-                
-        # Handle user related callbacks
-        elif main_type == "user":
-            if parts[1] == "details":
-                await handle_user_details(client, callback)
-            elif parts[1] == "stats":
-                await handle_user_stats(client, callback)
-                
-        # Handle ban related callbacks
-        elif main_type == "banned" or main_type == "unban":
-            if parts[1] == "user":
-                if main_type == "banned":
-                    await handle_banned_user_details(client, callback)
-                else:
-                    await handle_user_unban(client, callback)
-                    
-        # Handle refresh callbacks
-        elif main_type == "refresh":
-            if parts[1] == "channels":
-                await refresh_channels_callback(client, callback)
-                
+        handler = _ADMIN_EXACT_DISPATCH.get(callback.data)
+        if handler is None:
+            prefix, _, rest = callback.data.partition("_")
+            action, _, tail = rest.partition("_")
+            key = (prefix, action)
+            handler = (tail and _ADMIN_TAIL_DISPATCH.get(key)) or _ADMIN_DISPATCH.get(key)
+        if handler is not None:
+            await handler(client, callback)
+
     except Exception as e:
         logger.error(f"Error in admin callback handler: {e}")
         await callback.answer(
@@ -1409,10 +1384,10 @@ async def handle_admin_callbacks(client: Client, callback: CallbackQuery):
 async def handle_file_send(client: Client, callback: CallbackQuery):
     """Handle file sending callbacks"""
     try:
-        file_id = callback.data.split("_")[1]
+        file_id = callback.data.partition("_")[2]
         
         # Get file from cache
-        file_cache = FileCache(client.db)
+        file_cache = client.file_cache
         cached_file = await file_cache.get_cached_file(file_id)
         
         try:
@@ -1423,10 +1398,10 @@ async def handle_file_send(client: Client, callback: CallbackQuery):
             )
             
             # Schedule message deletion
-            asyncio.create_task(delete_message_later(sent_msg))
+            run_in_background(delete_message_later(sent_msg), "schedule file deletion")
             
             # Update download count in user stats
-            user_model = User(client.db)
+            user_model = client.user_db
             await user_model.update_user_stats(
                 callback.from_user.id,
                 download=True
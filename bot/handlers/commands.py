@@ -11,22 +11,27 @@ from loguru import logger
 
 db = Database()
 
+SUPPORT_ROW = [
+    InlineKeyboardButton("🆘 Support Group", url="https://t.me/bots_arena_support"),
+    InlineKeyboardButton("📡 Bot Channel", url="https://t.me/bots_arena")
+]
+START_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("⚔️ Search Files ⚔️", switch_inline_query_current_chat="")],
+    SUPPORT_ROW
+])
+HELP_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔍 Try Searching 🔍", switch_inline_query_current_chat="")],
+    SUPPORT_ROW
+])
 
 
 async def start_command(client: Client, message: Message):
     """Handle /start command"""
     try:
         await db.add_user(message.from_user.id)
-        buttons = [
-            [InlineKeyboardButton("⚔️ Search Files ⚔️", switch_inline_query_current_chat="")],
-            [
-                InlineKeyboardButton("🆘 Support Group", url=f"https://t.me/bots_arena_support"),
-                InlineKeyboardButton("📡 Bot Channel", url=f"https://t.me/bots_arena")
-            ]
-        ]
         await message.reply_text(
             Messages.START,
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=START_KB
         )
     except Exception as e:
         logger.error(f"Error in start command: {e}")
@@ -34,18 +39,11 @@ async def start_command(client: Client, message: Message):
 async def help_command(client: Client, message: Message):
     """Handle /help command"""
     try:
-        buttons = [[
-            InlineKeyboardButton("🔍 Try Searching 🔍", switch_inline_query_current_chat="")
-        ],
-        [
-                InlineKeyboardButton("🆘 Support Group", url=f"https://t.me/bots_arena_support"),
-                InlineKeyboardButton("📡 Bot Channel", url=f"https://t.me/bots_arena")
-            ]]
         await message.reply_text(
             Messages.HELP.format(
                 username=Config.USERNAME_OF_BOT
             ),
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=HELP_KB
         )
     except Exception as e:
         logger.error(f"Error in help command: {e}")
@@ -57,10 +55,8 @@ async def about_command(client: Client, message: Message):
         buttons = [[
             InlineKeyboardButton("👑 Owner 👑", url=f"https://t.me/{user_info["username"]}")
         ],
-        [
-                InlineKeyboardButton("🆘 Support Group", url=f"https://t.me/bots_arena_support"),
-                InlineKeyboardButton("📡 Bot Channel", url=f"https://t.me/bots_arena")
-            ]]
+            SUPPORT_ROW
+        ]
         total_users = await db.get_user_stats()
         await message.reply_text(
             Messages.ABOUT.format(
@@ -76,7 +72,6 @@ async def about_command(client: Client, message: Message):
 async def command_in_group(client: Client, message: Message):
     """Handle commands in groups"""
     try:
-        bot = await client.get_me()
         buttons = [[
             InlineKeyboardButton("🤖 Start in Private", url=f"https://t.me/{Config.USERNAME_OF_BOT}")
         ]]
@@ -1,4 +1,6 @@
-from typing import Any, List, Dict, Optional
+import time
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Tuple
 from pyrogram import Client
 from pyrogram.types import (
     InlineQuery, 
@@ -8,21 +10,34 @@ from pyrogram.types import (
     InlineKeyboardButton
 )
 from pyrogram.enums import ParseMode
-from bot.database.models import User
-from ..helpers.utils import check_user_in_channel
+from ..helpers.utils import check_user_in_channel, gather_bounded
 from ..templates.messages import Messages
 from ..config.config import Config
-from ..database import FileCache
 from loguru import logger
-import hashlib
-import base64
+from ..database.models import make_short_id
+
+# Optional thumbnails; Config doesn't define them unless a deployment adds them
+_MIN_LENGTH_THUMB_URL = getattr(Config, 'MIN_LENGTH_THUMB_URL', None)
+_UNAUTHORIZED_THUMB_URL = getattr(Config, 'UNAUTHORIZED_THUMB_URL', None)
+_FORCE_SUB_THUMB_URL = getattr(Config, 'FORCE_SUB_THUMB_URL', None)
+_FILE_THUMB_URL = getattr(Config, 'FILE_THUMB_URL', None)
+_NO_RESULTS_THUMB_URL = getattr(Config, 'NO_RESULTS_THUMB_URL', None)
+
+TYPE_EMOJI = {
+    'document': '📄',
+    'video': '🎥',
+    'audio': '🎵',
+    'photo': '🖼️',
+    'voice': '🎤',
+    'animation': '🎞️'
+}
 
 def create_short_file_id(file_id: str) -> str:
     """Create a short identifier for a file ID"""
-    return base64.urlsafe_b64encode(
-        hashlib.md5(file_id.encode()).digest()[:6]
-    ).decode().rstrip('=')
+    return make_short_id(file_id)
 
+# The static results below are built once on first use and then shared
+@lru_cache(maxsize=None)
 def create_min_length_result() -> InlineQueryResultArticle:
     """Create result for minimum length requirement"""
     return InlineQueryResultArticle(
@@ -32,7 +47,7 @@ def create_min_length_result() -> InlineQueryResultArticle:
             parse_mode=ParseMode.MARKDOWN
         ),
         description="Minimum 3 characters required for search",
-        thumb_url=Config.MIN_LENGTH_THUMB_URL if hasattr(Config, 'MIN_LENGTH_THUMB_URL') else None,
+        thumb_url=_MIN_LENGTH_THUMB_URL,
         reply_markup=InlineKeyboardMarkup([[
             InlineKeyboardButton(
                 "🔍 How to Search",
@@ -41,6 +56,7 @@ def create_min_length_result() -> InlineQueryResultArticle:
         ]])
     )
 
+@lru_cache(maxsize=None)
 def create_unauthorized_result() -> InlineQueryResultArticle:
     """Create result for unauthorized users"""
     return InlineQueryResultArticle(
@@ -50,13 +66,21 @@ def create_unauthorized_result() -> InlineQueryResultArticle:
             parse_mode=ParseMode.MARKDOWN
         ),
         description="This power can only be used in authorized guilds",
-        thumb_url=Config.UNAUTHORIZED_THUMB_URL if hasattr(Config, 'UNAUTHORIZED_THUMB_URL') else None
+        thumb_url=_UNAUTHORIZED_THUMB_URL
     )
 
+FORCE_SUB_RESULT_TTL = 3600  # seconds
+# Force-sub channel ID -> (expiry, built result); saves the chat lookups and invite link per query
+_force_sub_cache: Dict[int, Tuple[float, InlineQueryResultArticle]] = {}
+
 async def create_force_sub_result(client: Client) -> InlineQueryResultArticle:
     """Create result for force subscribe requirement"""
     if not Config.FORCE_SUB_CHANNEL:
         return create_unauthorized_result()
+
+    cached = _force_sub_cache.get(Config.FORCE_SUB_CHANNEL)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
     
     try:
         channel = await client.get_chat(Config.FORCE_SUB_CHANNEL)
@@ -68,7 +92,7 @@ async def create_force_sub_result(client: Client) -> InlineQueryResultArticle:
             try:
                 chat_member = await client.get_chat_member(
                     Config.FORCE_SUB_CHANNEL,
-                    (await client.get_me()).id
+                    (await client.get_bot_user()).id
                 )
                 if chat_member.privileges and chat_member.privileges.can_invite_users:
                     invite_link = await client.create_chat_invite_link(Config.FORCE_SUB_CHANNEL)
@@ -83,14 +107,14 @@ async def create_force_sub_result(client: Client) -> InlineQueryResultArticle:
             else:
                 invite_link = f"https://t.me/+{abs(Config.FORCE_SUB_CHANNEL)}"
 
-        return InlineQueryResultArticle(
+        result = InlineQueryResultArticle(
             title="⚠️ Join Required",
             input_message_content=InputTextMessageContent(
                 Messages.FORCE_SUB,
                 parse_mode=ParseMode.MARKDOWN
             ),
             description=f"Join {channel.title} to use the bot",
-            thumb_url=Config.FORCE_SUB_THUMB_URL if hasattr(Config, 'FORCE_SUB_THUMB_URL') else None,
+            thumb_url=_FORCE_SUB_THUMB_URL,
             reply_markup=InlineKeyboardMarkup([[
                 InlineKeyboardButton(
                     "🔱 Join Channel 🔱",
@@ -98,10 +122,50 @@ async def create_force_sub_result(client: Client) -> InlineQueryResultArticle:
                 )
             ]])
         )
+        _force_sub_cache[Config.FORCE_SUB_CHANNEL] = (time.monotonic() + FORCE_SUB_RESULT_TTL, result)
+        return result
     except Exception as e:
         logger.error(f"Error creating force sub result: {e}")
+        _force_sub_cache.pop(Config.FORCE_SUB_CHANNEL, None)
         return create_unauthorized_result()
 
+def build_file_result(file: Dict, cached_file: Optional[Dict], short_id: str) -> InlineQueryResultArticle:
+    """Build the inline result for one found file"""
+    access_count = cached_file.get('access_count', 0) if cached_file else 0
+    size = f"{file['file_size'] / 1024 / 1024:.2f} MB"
+    popularity = "🔥" if access_count > 10 else ""
+
+    file_type = file.get('type', 'document')
+    type_emoji = TYPE_EMOJI.get(file_type, '📄')
+
+    return InlineQueryResultArticle(
+        title=f"{popularity}{type_emoji} {file['file_name']}",
+        input_message_content=InputTextMessageContent(
+            f"🗡️ **File Name**: {file['file_name']}\n"
+            f"💠 **Size**: {size}\n"
+            f"📥 **Downloads**: {access_count}\n"
+            f"📁 **Type**: {file_type.title()}\n\n"
+            f"⚡️ *Summoning your file from the shadow realm...*",
+            parse_mode=ParseMode.MARKDOWN
+        ),
+        description=f"Size: {size} | Downloads: {access_count}",
+        thumb_url=_FILE_THUMB_URL,
+        reply_markup=InlineKeyboardMarkup([
+            [
+                InlineKeyboardButton(
+                    "📥 Extract Artifact 📥",
+                    callback_data=f"dl_{short_id}"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    "🤖 Start Bot",
+                    url="https://t.me/Searchkrlobot"
+                )
+            ]
+        ])
+    )
+
 class FileSearchManager:
     def __init__(self, client: Client, db=None):
         self.client = client
@@ -135,14 +199,15 @@ class FileSearchManager:
             logger.error("No search channels configured")
             return []
 
-        # Search each channel
-        for channel_id in search_channels:
-            try:
-                channel_results = await self._search_channel(channel_id, query)
-                all_results.extend(channel_results)
-            except Exception as e:
-                logger.error(f"Error searching channel {channel_id}: {e}")
+        # Search the channels concurrently; results keep the configured channel order
+        channel_results = await gather_bounded(
+            self._search_channel(channel_id, query) for channel_id in search_channels
+        )
+        for channel_id, result in zip(search_channels, channel_results):
+            if isinstance(result, Exception):
+                logger.error(f"Error searching channel {channel_id}: {result}")
                 continue
+            all_results.extend(result)
 
         return all_results[:Config.MAX_RESULTS]
 
@@ -272,62 +337,23 @@ async def handle_inline_query(client: Client, query: InlineQuery):
         files = await search_manager.search_all_channels(search_text)
         
         results = []
-        file_cache = FileCache(client.db)
+        file_cache = client.file_cache
+        # One query for every result's cached doc, one bulk write for the short ID mappings
+        cached_files = await file_cache.get_cached_files_bulk([file['file_id'] for file in files])
+        short_id_pairs = []
 
         for file in files:
             try:
-                cached_file = await file_cache.get_cached_file(file['file_id'])
-                access_count = cached_file.get('access_count', 0) if cached_file else 0
-                
                 short_id = create_short_file_id(file['file_id'])
-                await file_cache.cache_short_id_mapping(short_id, file['file_id'])
-                
-                size = f"{file['file_size'] / 1024 / 1024:.2f} MB"
-                popularity = "🔥" if access_count > 10 else ""
-                
-                file_type = file.get('type', 'document')
-                type_emoji = {
-                    'document': '📄',
-                    'video': '🎥',
-                    'audio': '🎵',
-                    'photo': '🖼️',
-                    'voice': '🎤',
-                    'animation': '🎞️'
-                }.get(file_type, '📄')
-                
-                results.append(
-                    InlineQueryResultArticle(
-                        title=f"{popularity}{type_emoji} {file['file_name']}",
-                        input_message_content=InputTextMessageContent(
-                            f"🗡️ **File Name**: {file['file_name']}\n"
-                            f"💠 **Size**: {size}\n"
-                            f"📥 **Downloads**: {access_count}\n"
-                            f"📁 **Type**: {file_type.title()}\n\n"
-                            f"⚡️ *Summoning your file from the shadow realm...*",
-                            parse_mode=ParseMode.MARKDOWN
-                        ),
-                        description=f"Size: {size} | Downloads: {access_count}",
-                        thumb_url=Config.FILE_THUMB_URL if hasattr(Config, 'FILE_THUMB_URL') else None,
-                        reply_markup=InlineKeyboardMarkup([
-                            [
-                                InlineKeyboardButton(
-                                    "📥 Extract Artifact 📥",
-                                    callback_data=f"dl_{short_id}"
-                                )
-                            ],
-                            [
-                                InlineKeyboardButton(
-                                    "🤖 Start Bot",
-                                    url="https://t.me/Searchkrlobot"
-                                )
-                            ]
-                        ])
-                    )
-                )
+                results.append(build_file_result(file, cached_files.get(file['file_id']), short_id))
+                short_id_pairs.append((short_id, file['file_id']))
             except Exception as e:
                 logger.error(f"Error processing file result: {e}")
                 continue
 
+        # Written before answering so the download buttons resolve as soon as they show
+        await file_cache.cache_short_id_mappings_bulk(short_id_pairs)
+
         if not results:
             logger.debug("No results found")
             results.append(
@@ -338,13 +364,13 @@ async def handle_inline_query(client: Client, query: InlineQuery):
                         parse_mode=ParseMode.MARKDOWN
                     ),
                     description="Try a different search term",
-                    thumb_url=Config.NO_RESULTS_THUMB_URL if hasattr(Config, 'NO_RESULTS_THUMB_URL') else None
+                    thumb_url=_NO_RESULTS_THUMB_URL
                 )
             )
 
         # Update user's search count
         try:
-            user_db = User(client.db)
+            user_db = client.user_db
             await user_db.update_user_stats(query.from_user.id, search=True)
         except Exception as e:
             logger.error(f"Error updating user stats: {e}")
@@ -2,16 +2,13 @@ from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton
 from ..templates.messages import Messages
 from ..helpers.decorators import force_subscribe
+from .admin import is_admin_or_owner, settings_overview_text
 from ..config.config import Config
 from loguru import logger
 import os
 from typing import Any
 from dotenv import load_dotenv, find_dotenv
 
-def is_admin_or_owner(user_id: int) -> bool:
-    """Check if user is admin or owner"""
-    return user_id == Config.OWNER_ID or user_id in Config.ADMIN_IDS
-
 async def update_env_setting(setting: str, value: Any) -> bool:
     """Update setting in .env file"""
     try:
@@ -41,6 +38,7 @@ async def update_env_setting(setting: str, value: Any) -> bool:
             
         # Update Config
         setattr(Config, setting, value)
+        settings_overview_text.cache_clear()
         
         # Reload environment variables
         load_dotenv()
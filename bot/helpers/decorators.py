@@ -1,4 +1,5 @@
 from functools import wraps
+from cachetools import TTLCache
 from loguru import logger
 from pyrogram.types import Message, InlineQuery, CallbackQuery
 from pyrogram.errors import UserNotParticipant, UserNotParticipant, ChatAdminRequired, ChannelPrivate
@@ -7,6 +8,9 @@ from ..config.config import Config
 from .utils import check_user_in_channel
 from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
+# Users recently confirmed as channel members skip the get_chat_member call
+_subscribed: TTLCache = TTLCache(maxsize=50_000, ttl=300)
+
 def force_subscribe(func):
     @wraps(func)
     async def decorator(client, update):
@@ -30,10 +34,15 @@ def force_subscribe(func):
                 logger.warning("No user_id found in update")
                 return await func(client, update)
 
+            if user_id in _subscribed:
+                return await func(client, update)
+
             try:
                 await client.get_chat_member(Config.FORCE_SUB_CHANNEL, user_id)
+                _subscribed[user_id] = True
                 return await func(client, update)
             except UserNotParticipant:
+                _subscribed.pop(user_id, None)
                 buttons = [[
                     InlineKeyboardButton(
                         "🔱 Join Channel 🔱",
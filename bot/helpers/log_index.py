@@ -0,0 +1,197 @@
+# bot/helpers/log_index.py
+import os
+import struct
+import threading
+from array import array
+from typing import Dict, List, Tuple
+from loguru import logger
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Index file layout: a header, then one record per refresh that found new lines.
+# Header: magic + inode of the indexed log. Record: byte position indexed up to,
+# level count, then per level its name and the offsets added for it.
+_MAGIC = b"SFLIDX2\n"
+_HEADER = struct.Struct("<8sQ")
+_RECORD = struct.Struct("<QH")
+_LEVEL = struct.Struct("<BI")
+
+
+class LogIndex:
+    """
+    Byte-offset index of line starts in a loguru log file, kept per level.
+
+    The index is extended incrementally as the log grows and persisted next
+    to the log, so paging through logs seeks straight to the lines it needs
+    instead of re-reading the whole file. Offsets live in compact arrays, and
+    each refresh only appends the offsets it added to the index file.
+    """
+
+    def __init__(self, path: str, index_path: str = None):
+        self.path = path
+        self.index_path = index_path or os.path.splitext(path)[0] + ".idx"
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._inode = None
+        self._indexed_to = 0
+        self._offsets: Dict[str, array] = {"ALL": array("Q")}
+        # Whether index_path holds a header for the current inode
+        self._persisted = False
+
+    def _reset(self, inode) -> None:
+        self._inode = inode
+        self._indexed_to = 0
+        self._offsets = {"ALL": array("Q")}
+        self._persisted = False
+
+    def _load(self) -> None:
+        """Restore a previously persisted index, if any"""
+        self._loaded = True
+        try:
+            with open(self.index_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable log index {self.index_path}: {e}")
+            return
+
+        if len(data) < _HEADER.size:
+            return
+        magic, inode = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            return
+
+        offsets: Dict[str, array] = {"ALL": array("Q")}
+        indexed_to = 0
+        pos = _HEADER.size
+        # A record cut short by a crash is ignored; the lines are re-indexed
+        try:
+            while pos < len(data):
+                record_to, level_count = _RECORD.unpack_from(data, pos)
+                cursor = pos + _RECORD.size
+                added = []
+                for _ in range(level_count):
+                    name_len, count = _LEVEL.unpack_from(data, cursor)
+                    cursor += _LEVEL.size
+                    level = data[cursor:cursor + name_len].decode("ascii", errors="replace")
+                    cursor += name_len
+                    values = array("Q")
+                    values.frombytes(data[cursor:cursor + count * values.itemsize])
+                    if len(values) != count:
+                        raise struct.error("truncated offsets")
+                    cursor += count * values.itemsize
+                    added.append((level, values))
+                for level, values in added:
+                    offsets.setdefault(level, array("Q")).extend(values)
+                indexed_to = record_to
+                pos = cursor
+        except struct.error:
+            pass
+
+        self._inode = inode
+        self._indexed_to = indexed_to
+        self._offsets = offsets
+        # Rewrite from scratch on the next save if the file had a torn tail
+        self._persisted = pos == len(data)
+
+    def _encode(self, levels: Dict[str, array]) -> bytes:
+        parts = [_RECORD.pack(self._indexed_to, len(levels))]
+        for level, values in levels.items():
+            name = level.encode("ascii", errors="replace")[:255]
+            parts.append(_LEVEL.pack(len(name), len(values)))
+            parts.append(name)
+            parts.append(values.tobytes())
+        return b"".join(parts)
+
+    def _save(self, added: Dict[str, array]) -> None:
+        """Append the offsets found by one refresh to the index file"""
+        try:
+            if self._persisted:
+                with open(self.index_path, "ab") as file:
+                    file.write(self._encode(added))
+            else:
+                # New or rotated log: start the file over with every offset held
+                with open(self.index_path, "wb") as file:
+                    file.write(_HEADER.pack(_MAGIC, self._inode))
+                    file.write(self._encode(self._offsets))
+                self._persisted = True
+        except OSError as e:
+            logger.warning(f"Could not persist log index: {e}")
+            self._persisted = False
+
+    def refresh(self) -> None:
+        """Index any lines appended since the last refresh"""
+        if not self._loaded:
+            self._load()
+
+        stat = os.stat(self.path)
+        # Rotation or truncation means the offsets no longer apply
+        if stat.st_ino != self._inode or stat.st_size < self._indexed_to:
+            self._reset(stat.st_ino)
+        if stat.st_size == self._indexed_to:
+            return
+
+        all_added = array("Q")
+        # Raw level bytes -> offsets added this refresh, so each level name is decoded once
+        buckets: Dict[bytes, array] = {}
+        with open(self.path, "rb") as file:
+            file.seek(self._indexed_to)
+            pos = self._indexed_to
+            pending = b""
+            while True:
+                chunk = file.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                data = pending + chunk
+                start = 0
+                while True:
+                    end = data.find(b"\n", start)
+                    if end == -1:
+                        break
+                    line = data[start:end]
+                    offset = pos + start
+                    all_added.append(offset)
+                    # Format: "time | LEVEL | name:function:line - message"
+                    fields = line.split(b" | ", 2)
+                    if len(fields) == 3:
+                        raw_level = fields[1].strip()
+                        bucket = buckets.get(raw_level)
+                        if bucket is None:
+                            bucket = buckets[raw_level] = array("Q")
+                        bucket.append(offset)
+                    start = end + 1
+                # Keep the unterminated tail for the next chunk
+                pending = data[start:]
+                pos += start
+
+        if pos == self._indexed_to:
+            return
+
+        added = {"ALL": all_added}
+        for raw_level, values in buckets.items():
+            level = raw_level.decode("ascii", errors="replace")
+            added[level] = values
+        for level, values in added.items():
+            self._offsets.setdefault(level, array("Q")).extend(values)
+        self._indexed_to = pos
+        self._save(added)
+
+    def read_page(self, level: str, page: int, per_page: int = 10) -> Tuple[List[str], int]:
+        """Return one page of lines for level, newest first, and the total matching lines"""
+        with self._lock:
+            self.refresh()
+            offsets = self._offsets.get(level, ())
+            total = len(offsets)
+            end = total - (page - 1) * per_page
+            start = max(0, end - per_page)
+            if end <= 0:
+                return [], total
+
+            lines = []
+            with open(self.path, "rb") as file:
+                for offset in offsets[start:end]:
+                    file.seek(offset)
+                    lines.append(file.readline().rstrip(b"\n").decode("utf-8", errors="replace"))
+            lines.reverse()
+            return lines, total
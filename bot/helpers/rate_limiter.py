@@ -0,0 +1,45 @@
+# bot/helpers/rate_limiter.py
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by all senders of a broadcast.
+
+    `acquire()` waits for a token (refilled at `rate` per second, up to
+    `capacity`); `pause(seconds)` stalls every waiter, e.g. on FloodWait.
+    """
+
+    def __init__(self, rate: float = 25, capacity: int = 25):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        # The lock queues waiters fairly; only its holder sleeps for a refill
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all acquirers for `seconds`"""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._resume_at
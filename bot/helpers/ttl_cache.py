@@ -0,0 +1,72 @@
+# bot/helpers/ttl_cache.py
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _default_key(*args, **kwargs) -> Hashable:
+    return repr((args, sorted(kwargs.items())))
+
+
+def async_ttl_cache(seconds: float, key: Optional[Callable[..., Hashable]] = None):
+    """
+    Cache an async function's results for `seconds`.
+
+    Entries are keyed on the stringified arguments, or on `key(*args, **kwargs)`
+    when given. Concurrent callers that miss on the same key share a single
+    in-flight call. The wrapper exposes `invalidate(*args, **kwargs)` and
+    `cache_clear()` for write paths that make cached values stale; calls
+    already in flight when either runs don't write their result back.
+    """
+    make_key = key or _default_key
+
+    def decorator(func):
+        cache: Dict[Hashable, Tuple[float, Any]] = {}
+        inflight: Dict[Hashable, asyncio.Task] = {}
+        # Bumped by invalidate/cache_clear so calls already in flight don't store stale results
+        generation = [0]
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            entry = cache.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            task = inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[cache_key] = task
+                started = generation[0]
+
+                def _store(done: asyncio.Task) -> None:
+                    if inflight.get(cache_key) is done:
+                        del inflight[cache_key]
+                    if started != generation[0]:
+                        return
+                    if not done.cancelled() and done.exception() is None:
+                        cache[cache_key] = (time.monotonic() + seconds, done.result())
+
+                task.add_done_callback(_store)
+
+            # Shield so one cancelled caller doesn't cancel the shared call
+            return await asyncio.shield(task)
+
+        def invalidate(*args, **kwargs) -> None:
+            cache_key = make_key(*args, **kwargs)
+            generation[0] += 1
+            cache.pop(cache_key, None)
+            # Later callers start a fresh call instead of joining the stale one
+            inflight.pop(cache_key, None)
+
+        def cache_clear() -> None:
+            generation[0] += 1
+            cache.clear()
+            inflight.clear()
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -1,9 +1,11 @@
 from loguru import logger
 from pyrogram import Client, enums
+from pyrogram.errors import FloodWait, MessageNotModified, RPCError
 from ..config.config import Config
 import asyncio
+from cachetools import LRUCache, TTLCache
 from datetime import datetime
-from typing import Any, Union, List, Dict, Optional
+from typing import Any, AsyncIterator, Union, List, Dict, Optional
 from ..database import FileCache
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -66,6 +68,74 @@ class SearchClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.stop()
 
+# Recently resolved Telegram users, keyed by user ID
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+async def get_user_cached(client: Client, user_id: int):
+    """Resolve a user via get_users, reusing lookups from the last five minutes"""
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await client.get_users(user_id)
+        _user_cache[user_id] = user
+    return user
+
+TELEGRAM_LOOKUP_CONCURRENCY = 10
+
+async def gather_bounded(coros, limit: int = TELEGRAM_LOOKUP_CONCURRENCY) -> List[Any]:
+    """
+    Like asyncio.gather(..., return_exceptions=True), but with at most
+    `limit` coroutines in flight so lookup fan-outs don't trip FloodWait.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+async def get_users_cached(client: Client, user_ids: List[int]) -> Dict[int, Any]:
+    """
+    Resolve several users at once, keyed by ID.
+
+    Cached users are reused and the rest are fetched with one bulk get_users
+    call. If the bulk call is rejected (e.g. one unknown peer), the missing
+    users are fetched individually; users that still can't be resolved are
+    left out of the result. FloodWait is raised to the caller.
+    """
+    found = {uid: _user_cache[uid] for uid in user_ids if uid in _user_cache}
+    missing = [uid for uid in user_ids if uid not in found]
+    if not missing:
+        return found
+
+    try:
+        fetched = await client.get_users(missing)
+    except FloodWait:
+        raise
+    except RPCError as e:
+        logger.warning(f"Bulk user lookup failed, falling back to single lookups: {e}")
+        results = await gather_bounded(client.get_users(uid) for uid in missing)
+        fetched = [user for user in results if not isinstance(user, Exception)]
+
+    for user in fetched:
+        _user_cache[user.id] = user
+        found[user.id] = user
+    return found
+
+async def batched_user_ids(cursor, size: int) -> AsyncIterator[List[int]]:
+    """Yield user_ids from a users cursor in lists of up to `size`, skipping docs without one"""
+    batch = []
+    async for doc in cursor:
+        user_id = doc.get('user_id')
+        if user_id is None:
+            continue
+        batch.append(user_id)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 async def check_user_in_channel(client: Client, user_id: int) -> bool:
     """Check if user is in force subscribe channel"""
     if not Config.FORCE_SUB_CHANNEL:
@@ -77,6 +147,67 @@ async def check_user_in_channel(client: Client, user_id: int) -> bool:
     except Exception:
         return False
 
+# Pending background work, referenced until it finishes
+_background_tasks: set = set()
+
+async def _logged(coro, action: str) -> None:
+    try:
+        await coro
+    except Exception as e:
+        logger.error(f"Failed to {action}: {e}")
+
+def run_in_background(coro, action: str) -> None:
+    """Run coro without awaiting it, logging (not raising) any failure to `action`"""
+    task = asyncio.create_task(_logged(coro, action))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def send_log(client: Client, text: str) -> None:
+    """Send text to the log channel in the background, if one is configured"""
+    if not Config.LOG_CHANNEL:
+        return
+    run_in_background(client.send_message(Config.LOG_CHANNEL, text), "send log message")
+
+# (chat_id, message_id) -> signature of the last text/keyboard rendered there
+_last_render: LRUCache = LRUCache(maxsize=10_000)
+
+def _markup_signature(markup) -> tuple:
+    if markup is None:
+        return ()
+    return tuple(
+        tuple((button.text, button.callback_data, button.url) for button in row)
+        for row in markup.inline_keyboard
+    )
+
+async def edit_if_changed(callback_query, text: str, reply_markup=None) -> bool:
+    """
+    Edit the callback's message unless it already shows this text and keyboard.
+
+    Returns False when the message was already up to date. Repeated Refresh
+    clicks are answered locally instead of costing a MessageNotModified
+    round-trip.
+    """
+    message = callback_query.message
+    if message is None:
+        # Inline-mode message; nothing to compare against
+        await callback_query.edit_message_text(text, reply_markup=reply_markup)
+        return True
+
+    key = (message.chat.id, message.id)
+    buttons = _markup_signature(reply_markup)
+    signature = (hash(text), buttons)
+    # The keyboard check catches edits made without this helper
+    if _last_render.get(key) == signature and _markup_signature(message.reply_markup) == buttons:
+        return False
+
+    edited = True
+    try:
+        await callback_query.edit_message_text(text, reply_markup=reply_markup)
+    except MessageNotModified:
+        edited = False
+    _last_render[key] = signature
+    return edited
+
 async def delete_message_later(message, delay: int = Config.DELETE_TIMEOUT):
     """Delete message after specified delay"""
     try:
@@ -184,8 +315,9 @@ async def search_files(
                         logger.error(f"Error accessing channel {channel_id}: {e}")
                         continue
 
-                    # Search messages
+                    # Search messages, buffering matches for one bulk cache write
                     message_count = 0
+                    to_cache = []
                     try:
                         async for message in client.user_bot.search_messages(
                             chat_id=int(channel_id),
@@ -241,12 +373,7 @@ async def search_files(
                                             'caption': message.caption
                                         })
                                         
-                                        # Cache the file
-                                        try:
-                                            await file_cache.cache_file(file_data)
-                                        except Exception as e:
-                                            logger.error(f"Error caching file: {e}")
-                                        
+                                        to_cache.append(dict(file_data))
                                         results.append(file_data)
                                         break  # Found a match, move to next message
                         
@@ -258,6 +385,9 @@ async def search_files(
                     except Exception as e:
                         logger.error(f"Error searching messages in channel {channel_id}: {e}")
                         continue
+                    finally:
+                        if to_cache:
+                            await file_cache.cache_files_bulk(to_cache)
                         
                 except Exception as e:
                     logger.error(f"Error processing channel {channel_id}: {e}")
@@ -1,17 +1,18 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from pyrogram import Client, idle
 from pyrogram.types import User as PyrogramUser
-from motor.motor_asyncio import AsyncIOMotorClient
 from .config.config import Config
 from .database.models import User, FileCache
+from .database.mongodb import Database
 from loguru import logger
 import platform
 import sys
 import os
 import pymongo
-from pymongo.errors import ConnectionFailure
+from cachetools import TTLCache
+from pymongo.errors import ConnectionFailure, OperationFailure
 import pyrogram
 
 if TYPE_CHECKING:
@@ -73,10 +74,11 @@ class ShadowFinder(Client):
         self.db = None
         self.user_db = None
         self.file_cache = None
-        self.uptime_start = datetime.now()
+        self.uptime_start = datetime.now(timezone.utc)
         self.tasks = []
         self.user_bot = None
-        self.user_states = {}
+        # Pending admin setting edits; abandoned flows expire on their own
+        self.user_states = TTLCache(maxsize=10_000, ttl=600)
         
         
         # Add custom peer type handler
@@ -93,6 +95,12 @@ class ShadowFinder(Client):
         pyrogram.utils.get_peer_type = get_peer_type_new
         self.register_handlers()
 
+    async def get_bot_user(self) -> PyrogramUser:
+        """The bot's own user; start() fetches it once, so this is normally free"""
+        if self.me is None:
+            self.me = await self.get_me()
+        return self.me
+
     async def clear_existing_sessions(self):
         """Clear any existing session files"""
         session_patterns = [
@@ -146,7 +154,8 @@ class ShadowFinder(Client):
             )
             
             await self.user_bot.start()
-            user = await self.user_bot.get_me()
+            # start() has already fetched the userbot's own user
+            user = self.user_bot.me
             logger.info(f"User bot started successfully as {user.first_name} (@{user.username})")
 
             # Join search channels
@@ -182,7 +191,7 @@ class ShadowFinder(Client):
                     else:
                         # For private channels, try to get invite link
                         try:
-                            bot_member = await self.get_chat_member(channel_id, (await self.get_me()).id)
+                            bot_member = await self.get_chat_member(channel_id, (await self.get_bot_user()).id)
                             if bot_member.privileges and bot_member.privileges.can_invite_users:
                                 invite = await self.create_chat_invite_link(channel_id)
                                 join_link = invite.invite_link
@@ -222,7 +231,7 @@ class ShadowFinder(Client):
                 # Get member status
                 member = await self.user_bot.get_chat_member(
                     chat.id,
-                    (await self.user_bot.get_me()).id
+                    self.user_bot.me.id
                 )
                 
                 logger.info(
@@ -261,8 +270,7 @@ class ShadowFinder(Client):
             if not Config.DB_URL:
                 raise DatabaseError("Database URL is not configured")
 
-            motor_client = AsyncIOMotorClient(Config.DB_URL)
-            self.db = motor_client.shadowfinder
+            self.db = Database().db
             
             # Instead of checking truthiness, check for None
             if self.db is None:
@@ -271,11 +279,8 @@ class ShadowFinder(Client):
             self.user_db = User(self.db)
             self.file_cache = FileCache(self.db)
             
-            # Create indexes
-            await self.db.users.create_index("user_id", unique=True)
-            await self.db.file_cache.create_index("file_id", unique=True)
-            await self.db.file_cache.create_index("file_name")
-            await self.db.file_cache.create_index("last_accessed")
+            await self.ensure_indexes()
+            await self.load_persisted_chats()
             
             logger.info("Database connection established")
             return True
@@ -287,6 +292,75 @@ class ShadowFinder(Client):
             logger.error(f"Database connection failed: {str(e)}")
             raise DatabaseError(f"Database initialization failed: {str(e)}")
 
+    async def ensure_indexes(self) -> None:
+        """Create the indexes backing the hot query paths"""
+        await self.db.users.create_index("user_id", unique=True)
+        # Partial index holding only banned users, so the banned count stays O(banned)
+        await self.db.users.create_index(
+            "banned",
+            name="banned_true",
+            partialFilterExpression={"banned": True}
+        )
+        # Covers the banned-users list (user_id + username), again only for banned users
+        await self.db.users.create_index(
+            [("banned", pymongo.ASCENDING), ("user_id", pymongo.ASCENDING), ("username", pymongo.ASCENDING)],
+            name="banned_list",
+            partialFilterExpression={"banned": True}
+        )
+        # Covers the broadcast cursor so it never has to fetch user documents
+        await self.db.users.create_index(
+            [("banned", pymongo.ASCENDING), ("user_id", pymongo.ASCENDING)],
+            partialFilterExpression={"banned": False}
+        )
+        # Most-active-users ranking and the active-users broadcast filter
+        await self.db.users.create_index([("downloads", pymongo.DESCENDING)])
+        await self.db.users.create_index("last_used")
+
+        # Per-user recent activity, newest first, and today's activity counts
+        for collection in (self.db.downloads, self.db.searches):
+            await collection.create_index(
+                [("user_id", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)]
+            )
+            await collection.create_index("timestamp")
+
+        # File cache lookups, popularity sorts and cleanup scans
+        await self.db.file_cache.create_index("file_id", unique=True)
+        await self.db.file_cache.create_index("file_unique_id")
+        await self.db.file_cache.create_index("file_name_lower")
+        await self.db.file_cache.create_index([("file_name", pymongo.TEXT)])
+        await self.db.file_cache.create_index([("access_count", pymongo.DESCENDING)])
+        await self.db.file_cache.create_index("last_accessed")
+        await self.db.file_cache.create_index("short_id", sparse=True)
+
+        # The text index covers name lookups, so the plain file_name index is dead weight
+        try:
+            await self.db.file_cache.drop_index("file_name_1")
+        except OperationFailure:
+            pass
+        # Docs cached before file_name_lower existed would never match prefix searches
+        backfill = await self.db.file_cache.update_many(
+            {'file_name_lower': {'$exists': False}, 'file_name': {'$type': 'string'}},
+            [{'$set': {'file_name_lower': {'$toLower': '$file_name'}}}]
+        )
+        if backfill.modified_count:
+            logger.info(f"Backfilled file_name_lower on {backfill.modified_count} cached files")
+
+        # Short ID -> file ID mappings used by download callbacks
+        await self.db.file_id_mappings.create_index("short_id", unique=True)
+
+    async def load_persisted_chats(self) -> None:
+        """Merge chats added at runtime via /addchannel and /addgroup into Config"""
+        async for doc in self.db.settings.find(
+            {'key': {'$in': ['extra_search_channels', 'extra_authorized_groups']}}
+        ):
+            chat_ids = doc.get('value') or []
+            if doc['key'] == 'extra_search_channels':
+                Config.SEARCH_CHANNELS.extend(
+                    chat_id for chat_id in chat_ids if chat_id not in Config.SEARCH_CHANNELS
+                )
+            else:
+                Config.AUTHORIZED_GROUPS.update(chat_ids)
+
     async def check_authorized_chats(self) -> None:
         """Verify bot's presence in authorized groups"""
         for chat_id in Config.AUTHORIZED_GROUPS:
@@ -303,7 +377,7 @@ class ShadowFinder(Client):
                 )
                 
                 # Check bot permissions
-                bot_member = await self.get_chat_member(chat.id, (await self.get_me()).id)
+                bot_member = await self.get_chat_member(chat.id, (await self.get_bot_user()).id)
                 if not bot_member.privileges:
                     logger.warning(f"Bot is not admin in {chat.title} ({chat.id})")
                 
@@ -324,6 +398,16 @@ class ShadowFinder(Client):
                 await asyncio.sleep(300)  # Wait 5 minutes before retrying
             await asyncio.sleep(86400)  # Run daily
 
+    async def flush_access_counts_task(self) -> None:
+        """Periodic task to write batched file access counts"""
+        while True:
+            await asyncio.sleep(5)
+            try:
+                if self.file_cache is not None:
+                    await self.file_cache.flush_access_counts()
+            except Exception as e:
+                logger.error(f"Access count flush error: {str(e)}")
+
     async def update_bot_stats_task(self) -> None:
         """Periodic task to update bot statistics"""
         while True:
@@ -336,10 +420,10 @@ class ShadowFinder(Client):
                 stats: Dict[str, Any] = {
                     'total_users': await self.db.users.count_documents({}),
                     'active_users': await self.db.users.count_documents({
-                        'last_used': {'$gte': datetime.now() - timedelta(days=7)}
+                        'last_used': {'$gte': datetime.now(timezone.utc) - timedelta(days=7)}
                     }),
                     'total_files': await self.db.file_cache.count_documents({}),
-                    'last_updated': datetime.now()
+                    'last_updated': datetime.now(timezone.utc)
                 }
                 
                 await self.db.stats.update_one(
@@ -398,7 +482,7 @@ class ShadowFinder(Client):
 
     def get_uptime(self) -> str:
         """Get bot uptime"""
-        delta = datetime.now() - self.uptime_start
+        delta = datetime.now(timezone.utc) - self.uptime_start
         days = delta.days
         hours, remainder = divmod(delta.seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -419,7 +503,7 @@ class ShadowFinder(Client):
             
             # Start bot client first
             await super().start()
-            me: PyrogramUser = await self.get_me()
+            me: PyrogramUser = await self.get_bot_user()
             logger.info(f"Bot Started as @{me.username}")
             
             # Initialize user bot after bot is started
@@ -432,7 +516,8 @@ class ShadowFinder(Client):
             # Start background tasks
             self.tasks.extend([
                 asyncio.create_task(self.clean_cache_task()),
-                asyncio.create_task(self.update_bot_stats_task())
+                asyncio.create_task(self.update_bot_stats_task()),
+                asyncio.create_task(self.flush_access_counts_task())
             ])
             
             # Send startup notification
@@ -464,12 +549,16 @@ class ShadowFinder(Client):
             if self.tasks:
                 await asyncio.gather(*self.tasks, return_exceptions=True)
             
+            # Write any access counts still pending
+            if self.file_cache is not None:
+                await self.file_cache.flush_access_counts()
+            
             # Send stop message to owner
             uptime = self.get_uptime()
             stop_msg = (
                 "⚠️ **Shadow Monarch's Messenger is shutting down** ⚠️\n\n"
                 f"⏰ Uptime: `{uptime}`\n"
-                f"📅 Stop Time: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+                f"📅 Stop Time: `{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}`"
             )
             
             await self.send_message(Config.OWNER_ID, stop_msg)
@@ -491,7 +580,7 @@ class ShadowFinder(Client):
             restart_msg = (
                 "🔄 **Shadow Monarch's Messenger is restarting** 🔄\n\n"
                 f"⏰ Uptime before restart: `{self.get_uptime()}`\n"
-                f"📅 Restart Time: `{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}`"
+                f"📅 Restart Time: `{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}`"
             )
             
             await self.send_message(Config.OWNER_ID, restart_msg)
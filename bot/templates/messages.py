@@ -119,6 +119,43 @@ User has been restored to the realm!
     BROADCAST_START = "📢 Starting broadcast..."
     BROADCAST_PROGRESS = "🔄 Broadcasting...\n✅ Success: {}\n❌ Failed: {}"
     BROADCAST_COMPLETE = "📢 **Broadcast Completed**\n\n✅ Success: {}\n❌ Failed: {}\n💠 Total: {}"
+    BROADCAST_RUNNING = "⏳ A broadcast is already running. Please wait for it to finish."
 
     SETTINGS_UPDATED = "✅ Settings updated successfully!"
-    SETTINGS_ERROR = "❌ Error updating settings: {}"
\ No newline at end of file
+    SETTINGS_ERROR = "❌ Error updating settings: {}"
+
+    # Log Channel Messages
+    BAN_LOG = """
+🚫 **User Banned**
+👤 **User**: {mention} [`{user_id}`]
+👮 **Admin**: {admin}
+📝 **Reason**: {reason}
+⏰ **Date**: {date}
+"""
+
+    UNBAN_LOG = """
+✅ **User Unbanned**
+👤 **User**: {mention} [`{user_id}`]
+👮 **Admin**: {admin}
+⏰ **Date**: {date}
+"""
+
+    ADMIN_ADDED_LOG = """
+🆕 **New Admin Added**
+👤 **Admin**: {mention} [`{user_id}`]
+👮 **Added by**: {admin}
+⏰ **Date**: {date}
+"""
+
+    CHAT_ADDED_LOG = """
+🆕 **{list_name} Added**
+📍 **Chat**: {title} [`{chat_id}`]
+👮 **Added by**: {admin}
+⏰ **Date**: {date}
+"""
+
+    RESTART_LOG = """
+🔄 **Bot Restart Initiated**
+👤 **Triggered By**: {admin}
+⏰ **Time**: {date}
+"""
@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import signal
 import sys
@@ -81,7 +81,7 @@ class BotRunner:
                          "• Configurations reloaded\n"
                          "• All systems operational\n\n"
                          f"⏱️ Restart initiated at: {restart_time}\n"
-                         f"⌛️ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                         f"⌛️ Completed at: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}"
                 )
                 
                 # Log the successful restart
@@ -89,7 +89,7 @@ class BotRunner:
                     await self.bot.send_message(
                         Config.LOG_CHANNEL,
                         "✅ **Bot Restart Completed**\n"
-                        f"⏰ **Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        f"⏰ **Time**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}"
                     )
                     
         except Exception as e: